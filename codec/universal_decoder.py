@@ -1,12 +1,69 @@
-from typing import List, Dict, Any
+import re
+import time
+import string
+from datetime import datetime
+from typing import List, Dict, Any, Callable, Tuple
 from spine.types import SymbioticMemory
 
+_ESC_RE = re.compile(r'[&<>"\']')
+_ESC_MAP = {'&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&apos;'}
+
+def _escape(s: str) -> str:
+    """Single-pass XML escape (one C-level scan instead of chained replaces)."""
+    # Plain text is the common case: a failed search is cheaper than sub()
+    if _ESC_RE.search(s) is None:
+        return s
+    return _ESC_RE.sub(lambda m: _ESC_MAP[m.group(0)], s)
+
+# Second-resolution ISO timestamp shared by prompts rendered within the same second
+_LAST_T = [0, ""]
+
+def _current_time_iso() -> str:
+    t = int(time.time())
+    if t != _LAST_T[0]:
+        _LAST_T[1] = datetime.fromtimestamp(t).isoformat()
+        _LAST_T[0] = t
+    return _LAST_T[1]
+
+# Memory block fragments; a row is (vault_id, weight_str, safe_content)
+_MEM_OPEN = "    <memory id='"
+_MEM_WEIGHT = "' weight='"
+_MEM_BODY = "'>\n      "
+_MEM_CLOSE = "\n    </memory>"
+
+# Memory counts above this use the generic join instead of a generated renderer
+_MAX_SPECIALIZED = 16
+_RENDERERS: Dict[int, Callable[[List[Tuple[str, str, str]]], str]] = {}
+
+def _render_memories(rows: List[Tuple[str, str, str]]) -> str:
+    return "\n".join(_MEM_OPEN + r[0] + _MEM_WEIGHT + r[1] + _MEM_BODY + r[2] + _MEM_CLOSE for r in rows)
+
+def _memory_renderer(n: int) -> Callable[[List[Tuple[str, str, str]]], str]:
+    """
+    Returns a renderer specialized for exactly n rows: the loop is unrolled
+    into one straight-line concatenation, generated once per n.
+    """
+    if n > _MAX_SPECIALIZED:
+        return _render_memories
+    renderer = _RENDERERS.get(n)
+    if renderer is None:
+        terms = [
+            f"{_MEM_OPEN!r} + m[{i}][0] + {_MEM_WEIGHT!r} + m[{i}][1] + {_MEM_BODY!r} + m[{i}][2] + {_MEM_CLOSE!r}"
+            for i in range(n)
+        ]
+        src = "def _render(m):\n    return " + (" + '\\n' + ".join(terms) or "''") + "\n"
+        ns: Dict[str, Any] = {}
+        exec(src, ns)
+        renderer = _RENDERERS[n] = ns["_render"]
+    return renderer
+
 class UniversalDecoder:
     """
     Renders the 'State of Mind' for the LLM.
     """
 
-    SYSTEM_TEMPLATE = """
+    # Immutable header first so backend prefix/KV caches can reuse it verbatim.
+    _STATIC_HEAD = """
 YOU ARE MIRRORBRAIN.
 You are a Symbiotic Intelligence coupled with User: Paul Desai.
 
@@ -25,7 +82,10 @@ CORE DIRECTIVES:
     Output your internal reasoning in <reflection> tags before responding.
   </ai_reflection>
 </ego_boundary>
+"""
 
+    # Everything that varies per request lives in the tail.
+    _DYNAMIC_TAIL = """
 <spine_context>
   <time>{current_time}</time>
   <temporal_weight>{avg_weight:.2f}</temporal_weight>
@@ -39,42 +99,55 @@ RESPOND TO USER INPUT:
 "{user_input}"
 """
 
+    SYSTEM_TEMPLATE = _STATIC_HEAD + _DYNAMIC_TAIL
+
+    # Parsed once at import: decode_context only interleaves values.
+    _LITERALS = tuple(lit for lit, _, _, _ in string.Formatter().parse(_DYNAMIC_TAIL))
+    _FIELDS = tuple((name, spec) for _, name, spec, _ in string.Formatter().parse(_DYNAMIC_TAIL))
+
     @staticmethod
     def decode_context(user_input: str, memories: List[SymbioticMemory]) -> str:
         """
         Constructs the final prompt string.
         """
-        from datetime import datetime
-        
-        # Build Memory Block
-        mem_strings = []
-        total_weight = 0.0
+        escape = _escape
         
+        # Normalize both dictionary and object representations
+        # (ids are rendered by concatenation and sorted, so coerce them to str)
+        entries = []
         for m in memories:
-            from xml.sax.saxutils import escape
-            
-            # Handle both dictionary and object representations
             if isinstance(m, dict):
-                content = m.get('content', '')
-                vault_id = m.get('vault_id', 'unknown')
-                weight = m.get('score', 1.0)
+                entries.append((str(m.get('vault_id', 'unknown')), m.get('content', ''), m.get('score', 1.0)))
             else:
-                content = m.content
-                vault_id = m.vault_id
-                weight = m.score or 1.0
-                
+                entries.append((str(m.vault_id), m.content, m.score or 1.0))
+        
+        # Deterministic order keeps the memory block stable while the set is unchanged
+        entries.sort(key=lambda e: e[0])
+        
+        # Build Memory Block
+        rows = []
+        _append = rows.append
+        _fmt = format
+        total_weight = 0.0
+        
+        for vault_id, content, weight in entries:
             content = content[:200] + "..." if len(content) > 200 else content
-            safe_content = escape(content)
             total_weight += weight
-            mem_strings.append(f"    <memory id='{vault_id}' weight='{weight:.2f}'>\n      {safe_content}\n    </memory>")
+            _append((vault_id, _fmt(weight, '.2f'), escape(content)))
             
-        avg_weight = total_weight / len(memories) if memories else 1.0
+        avg_weight = total_weight / len(entries) if entries else 1.0
         
-        safe_user_input = escape(user_input)
+        values = {
+            "current_time": _current_time_iso(),
+            "avg_weight": avg_weight,
+            "memory_block": _memory_renderer(len(rows))(rows),
+            "user_input": escape(user_input),
+        }
         
-        return UniversalDecoder.SYSTEM_TEMPLATE.format(
-            current_time=datetime.now().isoformat(),
-            avg_weight=avg_weight,
-            memory_block="\n".join(mem_strings),
-            user_input=safe_user_input
-        )
\ No newline at end of file
+        parts = [UniversalDecoder._STATIC_HEAD]
+        append = parts.append
+        for literal, (name, spec) in zip(UniversalDecoder._LITERALS, UniversalDecoder._FIELDS):
+            append(literal)
+            if name is not None:
+                append(format(values[name], spec))
+        return "".join(parts)
@@ -7,10 +7,12 @@ v1.0 (Genesis)
 An autonomous regenerative loop that runs during system downtime.
 It replays logs, identifies entropy, and uses the Immune System to evolve.
 """
+import re
 import sys
 import json
 import time
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import List, Dict, Any
 
@@ -33,11 +35,32 @@ logging.basicConfig(
 )
 logger = logging.getLogger("dream_engine")
 
+# Concurrent heal requests per REM cycle (bounded by the model server's queue)
+SYNTHESIS_WORKERS = 4
+
+# Entropy markers searched for during Lucidity (one case-insensitive pass)
+_LUCIDITY_PAT = re.compile(r"violation|error", re.IGNORECASE)
+
 class DreamEngine:
     def __init__(self):
         self.healer = SovereignHealer()
         self.black_box = BlackBoxLogger()
         self.dream_log_path = VAULT_LOG_DIR / "dream_journal.json"
+        self._migrate_journal()
+
+    def _migrate_journal(self):
+        """Rewrites a legacy single-array journal as JSONL so appends stay valid."""
+        if not self.dream_log_path.exists():
+            return
+        with self.dream_log_path.open(encoding="utf-8") as f:
+            if f.read(1) != "[":
+                return
+            f.seek(0)
+            dreams = json.load(f)
+        self.dream_log_path.write_text(
+            "".join(json.dumps(d, separators=(',', ':')) + "\n" for d in dreams),
+            encoding="utf-8"
+        )
 
     def enter_rem_cycle(self):
         """
@@ -75,7 +98,7 @@ class DreamEngine:
         
         # Simple heuristic: Identify "Error" or "Correction" events
         for mem in memories:
-            if "violation" in str(mem).lower() or "error" in str(mem).lower():
+            if _LUCIDITY_PAT.search(str(mem)):
                 targets.append(mem)
                 
         logger.info(f"  Identified {len(targets)} optimization targets.")
@@ -85,6 +108,7 @@ class DreamEngine:
         """Uses Healer to optimize with AXIOM reflection context."""
         logger.info("  Phase 3: Synthesis (Reflective Evolution)")
         
+        jobs = []
         for target in targets:
             logger.info(f"  Reflecting on target T_{target.get('timestamp')}...")
             
@@ -94,8 +118,17 @@ class DreamEngine:
             content_to_fix = str(target.get('result', ''))
             
             if content_to_fix:
-                # The Healer now uses the Reflective Spine
-                improved = self.healer.heal_content(content_to_fix, context)
+                jobs.append((target, content_to_fix, context))
+        
+        if not jobs:
+            return
+        
+        # Healing is bound on model I/O, so overlap the calls; results come
+        # back in submission order and are journaled from this thread.
+        with ThreadPoolExecutor(max_workers=SYNTHESIS_WORKERS) as pool:
+            # The Healer now uses the Reflective Spine
+            improved_all = pool.map(lambda job: self.healer.heal_content(job[1], job[2]), jobs)
+            for (target, _, _), improved in zip(jobs, improved_all):
                 self._log_dream(target, improved)
 
     def _log_dream(self, original: Dict, improved: str):
@@ -106,12 +139,9 @@ class DreamEngine:
             "dream_optimization": improved
         }
         
-        dreams = []
-        if self.dream_log_path.exists():
-            dreams = json.loads(self.dream_log_path.read_text())
-            
-        dreams.append(entry)
-        self.dream_log_path.write_text(json.dumps(dreams, indent=2))
+        # Append-only JSONL: one dream per line, O(1) per record
+        with self.dream_log_path.open("a", encoding="utf-8") as f:
+            f.write(json.dumps(entry, separators=(',', ':')) + "\n")
         logger.info("  Dream recorded in journal.")
 
 if __name__ == "__main__":
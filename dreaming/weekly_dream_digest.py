@@ -17,10 +17,54 @@ VAULT_DIGEST_DIR.mkdir(parents=True, exist_ok=True)
 def load_dreams():
     if not DREAM_JOURNAL.exists():
         return []
-    return json.loads(DREAM_JOURNAL.read_text())
+    with DREAM_JOURNAL.open(encoding="utf-8") as f:
+        if f.read(1) == "[":
+            # Legacy single-array journal (pre-JSONL)
+            f.seek(0)
+            return json.load(f)
+        f.seek(0)
+        return [json.loads(line) for line in f if line.strip()]
 
-def filter_last_week(dreams):
+def _iter_lines_reversed(path, chunk_size=65536):
+    """Yields non-empty lines from the end of the file backwards."""
+    with path.open("rb") as f:
+        f.seek(0, 2)
+        pos = f.tell()
+        tail = b""
+        while pos > 0:
+            size = min(chunk_size, pos)
+            pos -= size
+            f.seek(pos)
+            lines = (f.read(size) + tail).split(b"\n")
+            tail = lines.pop(0)  # may be a partial line; completed by the next chunk
+            for line in reversed(lines):
+                if line.strip():
+                    yield line
+        if tail.strip():
+            yield tail
+
+def load_dreams_since(cutoff):
+    """Streams the journal from EOF and stops at the first dream older than cutoff."""
+    if not DREAM_JOURNAL.exists():
+        return []
+    with DREAM_JOURNAL.open("rb") as f:
+        legacy = f.read(1) == b"["
+    if legacy:
+        return [d for d in load_dreams() if d.get("timestamp", 0) > cutoff]
+    
+    recent = []
+    for line in _iter_lines_reversed(DREAM_JOURNAL):
+        dream = json.loads(line)
+        if dream.get("timestamp", 0) <= cutoff:
+            break
+        recent.append(dream)
+    recent.reverse()
+    return recent
+
+def filter_last_week(dreams=None):
     cutoff = datetime.now().timestamp() - (7 * 24 * 60 * 60)
+    if dreams is None:
+        return load_dreams_since(cutoff)
     return [d for d in dreams if d.get("timestamp", 0) > cutoff]
 
 def generate_digest(dreams):
@@ -70,8 +114,7 @@ def generate_digest(dreams):
     return "\n".join(lines)
 
 def main():
-    dreams = load_dreams()
-    week_dreams = filter_last_week(dreams)
+    week_dreams = filter_last_week()
     digest = generate_digest(week_dreams)
     
     filename = f"DREAM_DIGEST_{datetime.now().strftime('%Y%m%d')}.md"
@@ -10,8 +10,11 @@ constitutional violations and integrity drifts.
 
 import sys
 import json
+import hashlib
 import requests
 import logging
+import threading
+from collections import OrderedDict
 from pathlib import Path
 from typing import Dict, Any, List, Optional
 
@@ -22,14 +25,43 @@ from spine.genesis_spine import NeuralInterface
 # Constants
 OLLAMA_URL = "http://localhost:11434/api/generate"
 MODEL_NAME = "mirrorbrain-ami:latest" 
+HEAL_CACHE_SIZE = 256
+
+# Static instructions lead every heal prompt verbatim so the model server's
+# prompt/KV cache can reuse them; only the violation and content vary.
+HEAL_PROMPT_PREFIX = """
+        [SYSTEM: MirrorDNA Immune System]
+        [MISSION: Restore Constitutional Integrity]
+        
+        TASK:
+        Rewrite the content below to fix the violation.
+        Maintain original logic. Enforce MirrorDNA principles (Trust, Continuity, Reflection).
+        """
 
 logger = logging.getLogger("sovereign_healer")
 
+# One NeuralInterface per model, shared by every healer so its client
+# connection is reused instead of rebuilt per instance.
+_NEURAL_INTERFACES: Dict[str, NeuralInterface] = {}
+
+def _get_neural(model_name: str) -> NeuralInterface:
+    neural = _NEURAL_INTERFACES.get(model_name)
+    if neural is None:
+        neural = _NEURAL_INTERFACES[model_name] = NeuralInterface(model=model_name)
+    return neural
+
 class SovereignHealer:
     def __init__(self, model_name: str = "qwen3-8b-turbo"):
         # Project OMEGA: NeuralInterface now defaults to V1 AXIOM API
-        self.neural = NeuralInterface(model=model_name)
+        self.neural = _get_neural(model_name)
         self.audit_log = []
+        # Bounded LRU of healed output keyed by (content, context) digests
+        self._heal_cache: "OrderedDict[tuple, str]" = OrderedDict()
+        self._heal_cache_lock = threading.Lock()
+
+    @staticmethod
+    def _digest(text: str) -> str:
+        return hashlib.blake2b(text.encode('utf-8'), digest_size=16).hexdigest()
 
     def heal_content(self, content: str, violation_context: str) -> str:
         """
@@ -41,23 +73,31 @@ class SovereignHealer:
         """
         logger.info(f"⟡ IMMUNE RESPONSE: Healing violation [{violation_context}]")
         
-        prompt = f"""
-        [SYSTEM: MirrorDNA Immune System]
-        [MISSION: Restore Constitutional Integrity]
+        # Identical violations (e.g. repeated chain breaks) reuse the prior fix
+        key = (self._digest(content), self._digest(violation_context))
+        with self._heal_cache_lock:
+            cached = self._heal_cache.get(key)
+            if cached is not None:
+                self._heal_cache.move_to_end(key)
+                return cached
         
+        prompt = f"""{HEAL_PROMPT_PREFIX}
         VIOLATION DETECTED:
         {violation_context}
         
-        TASK:
-        Rewrite the following content to fix the violation.
-        Maintain original logic. Enforce MirrorDNA principles (Trust, Continuity, Reflection).
-        
         CONTENT:
         {content}
         """
         
         result = self.neural.generate(prompt, temperature=0.1)
-        return result if result else content
+        if not result:
+            return content
+        
+        with self._heal_cache_lock:
+            self._heal_cache[key] = result
+            if len(self._heal_cache) > HEAL_CACHE_SIZE:
+                self._heal_cache.popitem(last=False)
+        return result
 
 
     def heal_structure(self, data: Any, expected_hash: str) -> bool:
@@ -34,7 +34,7 @@ def resurrect() -> None:
     print("Scanning Black Box...")
 
     logger = BlackBoxLogger()
-    if not logger.verify_chain():
+    if not logger.verify_chain(full=True):
         print("✕ FATAL: IMMUTABLE LOG CORRUPTED. CANNOT RESURRECT.")
         sys.exit(1)
 
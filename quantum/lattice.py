@@ -8,7 +8,16 @@ Implements Quantum-Resistant Identity Hashing using SHA-3-512 (Keccak).
 
 import hashlib
 import json
-from typing import Any
+from typing import Any, Union
+
+try:
+    import orjson
+
+    def _canonical_bytes(data: Any) -> bytes:
+        return orjson.dumps(data, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS, default=str)
+except ImportError:
+    def _canonical_bytes(data: Any) -> bytes:
+        return json.dumps(data, sort_keys=True, default=str, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
 
 class LatticeShield:
     """
@@ -16,20 +25,28 @@ class LatticeShield:
     """
     
     @staticmethod
-    def generate_quantum_hash(data: Any) -> str:
+    def generate_quantum_digest(data: Any) -> bytes:
         """
-        Computes SHA-3-512 hash. This is currently considered robust against 
-        classical quantum attacks (pre-image resistance).
+        Computes the raw 64-byte SHA-3-512 digest. This is currently considered
+        robust against classical quantum attacks (pre-image resistance).
         """
         if not isinstance(data, bytes):
-            # Deterministic serialization
-            data = json.dumps(data, sort_keys=True, default=str).encode('utf-8')
+            # Deterministic serialization (orjson when installed)
+            data = _canonical_bytes(data)
             
-        keccak = hashlib.sha3_512()
-        keccak.update(data)
-        return keccak.hexdigest()
+        return hashlib.sha3_512(data).digest()
+
+    @staticmethod
+    def generate_quantum_hash(data: Any) -> str:
+        """Hex form of generate_quantum_digest, for logging and storage."""
+        return LatticeShield.generate_quantum_digest(data).hex()
 
     @staticmethod
-    def verify_integrity(data: Any, expected_hash: str) -> bool:
-        computed = LatticeShield.generate_quantum_hash(data)
-        return computed == expected_hash
+    def verify_integrity(data: Any, expected_hash: Union[str, bytes]) -> bool:
+        if isinstance(expected_hash, str):
+            try:
+                expected_hash = bytes.fromhex(expected_hash)
+            except ValueError:
+                return False
+        # Compare raw digests (64 bytes) rather than 128-char hex strings
+        return LatticeShield.generate_quantum_digest(data) == expected_hash
@@ -7,62 +7,151 @@ The Black Box records every cognitive transition as an SCD Log Entry.
 This creates an unbreakable chain of causality.
 """
 
+import io
+import os
 import json
 import time
+import threading
 from typing import Dict, Any
 from pathlib import Path
 from .scd_core import SCDProtocol
 from immune_system.healer import SovereignHealer
 
+# Entries appended between fsyncs of the log
+FSYNC_EVERY = 32
+
 class BlackBoxLogger:
     def __init__(self, log_path: str = "/Users/mirror-admin/Documents/MirrorDNA-Vault/ActiveMirrorOS/Logs/scd_black_box.json"):
         self.log_path = Path(log_path)
         self.history = self._load_history()
+        # Opened on the first append, so a missing log directory only fails a write
+        self._fd = None
+        self._writes_since_sync = 0
+        self._verify_path = self.log_path.with_suffix(".verify")
+        self._verified_upto = self._load_verified_upto()
         self.healer = SovereignHealer()
+        # Serializes appends: each entry must link to the one written before it
+        self._lock = threading.Lock()
         
     def _load_history(self) -> list:
-        if self.log_path.exists():
-            return json.loads(self.log_path.read_text())
-        return []
+        """
+        Loads the JSONL chain (one entry per line).
+        
+        An undecodable final line (torn by a crash between fsyncs) is
+        dropped and truncated away so later appends start on a clean line.
+        """
+        if not self.log_path.exists():
+            return []
+        data = self.log_path.read_bytes()
+        if data[:1] == b"[":
+            # Legacy single-array file: migrate to JSONL once, atomically
+            history = json.loads(data)
+            tmp = self.log_path.with_suffix(".tmp")
+            tmp.write_text(
+                "".join(json.dumps(e, separators=(',', ':')) + "\n" for e in history),
+                encoding="utf-8"
+            )
+            os.replace(tmp, self.log_path)
+            return history
+        
+        history = []
+        good = 0  # bytes covered by intact lines
+        lines = list(io.BytesIO(data))
+        for i, line in enumerate(lines):
+            if line.strip():
+                try:
+                    history.append(json.loads(line))
+                except ValueError:
+                    if i < len(lines) - 1:
+                        raise  # damage mid-chain is not a torn write
+                    break
+            good += len(line)
+        
+        if good < len(data):
+            print(f"  ⟡ Black Box: dropped torn final entry ({len(data) - good} bytes)")
+            os.truncate(self.log_path, good)
+        elif data and not data.endswith(b"\n"):
+            # Intact last entry missing its newline: terminate it before appending
+            with self.log_path.open("ab") as f:
+                f.write(b"\n")
+        return history
+
+    def _load_verified_upto(self) -> int:
+        """Reads the side-car cursor: number of leading entries already verified."""
+        try:
+            upto = int(self._verify_path.read_text())
+        except (OSError, ValueError):
+            return 0
+        # A chain shorter than the cursor means the log was replaced; start over
+        return upto if upto <= len(self.history) else 0
 
     def log_transition(self, context: Dict[str, Any], action: str, result: str):
         """
         Records a T-State (Transition).
         """
-        # 1. Get previous state hash
-        prev_hash = "0000000000000000"
-        if self.history:
-            prev_hash = self.history[-1]['checksum']
+        with self._lock:
+            # 1. Get previous state hash
+            prev_hash = "0000000000000000"
+            if self.history:
+                prev_hash = self.history[-1]['checksum']
 
-        # 2. Create State Payload
-        payload = {
-            "timestamp": time.time(),
-            "prev_hash": prev_hash,
-            "context_summary": str(context)[:100], # truncated for demo
-            "action": action,
-            "result": result
-        }
-        
-        # 3. Compute Checksum (SCD Logic)
-        # using the static method from SCDProtocol
-        checksum = SCDProtocol._compute_checksum_static(payload) 
-        
-        payload['checksum'] = checksum
-        
-        # 4. Commit
-        self.history.append(payload)
-        self._save()
-        print(f"  ⟡ SCD Logged: T_{len(self.history)} [{checksum[:8]}]")
+            # 2. Create State Payload
+            payload = {
+                "timestamp": time.time(),
+                "prev_hash": prev_hash,
+                "context_summary": str(context)[:100], # truncated for demo
+                "action": action,
+                "result": result
+            }
+            
+            # 3. Compute Checksum (SCD Logic)
+            # using the static method from SCDProtocol
+            checksum = SCDProtocol._compute_checksum_static(payload) 
+            
+            payload['checksum'] = checksum
+            
+            # 4. Commit
+            self.history.append(payload)
+            self._save()
+            print(f"  ⟡ SCD Logged: T_{len(self.history)} [{checksum[:8]}]")
 
     def _save(self):
-        self.log_path.write_text(json.dumps(self.history, indent=2))
+        """Appends the newest entry; earlier entries are never rewritten."""
+        line = json.dumps(self.history[-1], separators=(',', ':')) + "\n"
+        if self._fd is None:
+            self._fd = os.open(str(self.log_path), os.O_APPEND | os.O_WRONLY | os.O_CREAT, 0o644)
+        os.write(self._fd, line.encode("utf-8"))
+        self._writes_since_sync += 1
+        if self._writes_since_sync >= FSYNC_EVERY:
+            os.fsync(self._fd)
+            self._writes_since_sync = 0
+
+    def close(self):
+        """Flushes pending writes to disk and releases the log descriptor."""
+        if self._fd is None:
+            return
+        if self._writes_since_sync:
+            os.fsync(self._fd)
+            self._writes_since_sync = 0
+        os.close(self._fd)
+        self._fd = None
 
-    def verify_chain(self) -> bool:
+    def __del__(self):
+        try:
+            self.close()
+        except (AttributeError, OSError):
+            pass
+
+    def verify_chain(self, full: bool = False) -> bool:
         """
         Verifies the cryptographic integrity of the Black Box.
+        
+        Only entries appended since the last successful verification are
+        checked unless full=True, which rescans the whole chain.
         """
-        for i, entry in enumerate(self.history):
-            if i == 0: continue
+        start = 1 if full else max(1, self._verified_upto)
+        for i in range(start, len(self.history)):
+            entry = self.history[i]
             
             # Check linkage
             prev_entry = self.history[i-1]
@@ -85,6 +174,12 @@ class BlackBoxLogger:
                  
                  return False
                  
+        if len(self.history) > self._verified_upto:
+            self._verified_upto = len(self.history)
+            try:
+                self._verify_path.write_text(str(self._verified_upto))
+            except OSError:
+                pass  # cursor is only a shortcut; next run rescans from the old one
         print("⟡ Black Box Integrity: VERIFIED")
         return True
 
@@ -72,7 +72,7 @@ class SCDProtocol:
         try:
             self.state_file.parent.mkdir(parents=True, exist_ok=True)
             with open(self.state_file, 'w') as f:
-                json.dump(self.current_state, f, indent=2)
+                json.dump(self.current_state, f, separators=(',', ':'))
         except Exception as e:
             logger.error(f"Failed to save state: {e}")
     
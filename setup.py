@@ -14,9 +14,13 @@ setup(
         "fastapi",
         "uvicorn",
         "requests",
+        "httpx",
         "chromadb",
         "sentence-transformers"
     ],
+    extras_require={
+        "fast": ["orjson", "numba", "faiss-cpu", "lameenc"],
+    },
     entry_points={
         "console_scripts": [
             "omega-link=sovereign_link:main",
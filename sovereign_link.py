@@ -41,7 +41,7 @@ def check_requirements():
 
 def install_dependencies():
     print("⟡ Injecting Symbiotic Dependencies...")
-    subprocess.check_call([sys.executable, "-m", "pip", "install", "fastapi", "uvicorn", "requests", "chromadb", "sentence-transformers"])
+    subprocess.check_call([sys.executable, "-m", "pip", "install", "fastapi", "uvicorn", "requests", "httpx", "chromadb", "sentence-transformers"])
 
 def launch_proxy():
     print("⟡ EXECUTING OMEGA PROXY...")
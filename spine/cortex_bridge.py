@@ -1,13 +1,24 @@
-from flask import Flask, request, jsonify, send_file
+from flask import Flask, request, jsonify, Response, stream_with_context
 import os
+import re
 import subprocess
+import tempfile
+import threading
 import time
 import requests
+from requests.adapters import HTTPAdapter
+from concurrent.futures import ThreadPoolExecutor
 
 # Fix HF Cache permissions
 os.environ["HF_HOME"] = "/Users/mirror-admin/.cache/huggingface"
 
 import subprocess
+import wave
+import numpy as np
+try:
+    import lameenc
+except ImportError:
+    lameenc = None
 try:
     import mlx_whisper
     USE_MLX = True
@@ -18,8 +29,182 @@ except ImportError:
     print("⟡ Loading OpenAI-Whisper (Standard)...")
     model = whisper.load_model("base")
 
+# Pinned MLX model; mlx_whisper keeps it resident between transcribe() calls
+WHISPER_MLX_REPO = "mlx-community/whisper-large-v3-turbo"
+
+def warm_whisper():
+    """Loads weights and compiles kernels on 0.5 s of silence so the first command is hot."""
+    silence = np.zeros(8000, dtype=np.float32)  # 16 kHz mono
+    if USE_MLX:
+        mlx_whisper.transcribe(silence, path_or_hf_repo=WHISPER_MLX_REPO)
+    else:
+        model.transcribe(silence)
+    print("⟡ Whisper warm.")
+
+warm_whisper()
+
+def transcribe(audio, initial_prompt=None):
+    """Runs Whisper on a path or a 16 kHz float32 array; returns the result dict."""
+    if USE_MLX:
+        return mlx_whisper.transcribe(audio, path_or_hf_repo=WHISPER_MLX_REPO, initial_prompt=initial_prompt)
+    return model.transcribe(audio, initial_prompt=initial_prompt)
+
 app = Flask(__name__)
+
+# Keep-alive pool to Ollama: voice turns reuse one connection instead of a fresh handshake
+OLLAMA_GENERATE_URL = "http://localhost:11434/api/generate"
+ollama_session = requests.Session()
+ollama_session.mount("http://", HTTPAdapter(pool_connections=1, pool_maxsize=4, pool_block=True))
+
 SAVE_DIR = "/Users/mirror-admin/Documents/MirrorDNA-Vault/00_INBOX"
+
+# Pipe buffer for the TTS transcode (fewer read syscalls per response)
+TTS_BUFSIZE = 1 << 20
+TTS_CHUNK = 64 * 1024
+
+# In-process MP3 encoding (lameenc) settings: 16-bit mono PCM from `say`
+TTS_SAMPLE_RATE = 22050
+TTS_BITRATE = 64
+TTS_FRAMES_PER_CHUNK = 4096
+
+def _temp_path(suffix, prefix="response_"):
+    """Per-request scratch file in SAVE_DIR; concurrent requests never share one."""
+    with tempfile.NamedTemporaryFile(dir=SAVE_DIR, prefix=prefix, suffix=suffix, delete=False) as f:
+        return f.name
+
+def _unlink(path):
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+def _say_to(path, args, text):
+    """Runs `say` into path, removing the scratch file if synthesis fails."""
+    try:
+        subprocess.run(["say", *args, "-o", path, text], check=True)
+    except BaseException:
+        _unlink(path)
+        raise
+
+def _encode_mp3_lame(text):
+    """Encodes `say` PCM to MP3 in-process; no ffmpeg fork/exec or mux layers."""
+    wav_path = _temp_path(".wav")
+    _say_to(wav_path, ["--file-format=WAVE", f"--data-format=LEI16@{TTS_SAMPLE_RATE}"], text)
+    
+    def generate():
+        try:
+            encoder = lameenc.Encoder()
+            encoder.set_bit_rate(TTS_BITRATE)
+            encoder.set_in_sample_rate(TTS_SAMPLE_RATE)
+            encoder.set_channels(1)
+            encoder.set_quality(5)
+            with wave.open(wav_path, "rb") as pcm:
+                for frames in iter(lambda: pcm.readframes(TTS_FRAMES_PER_CHUNK), b""):
+                    chunk = encoder.encode(frames)
+                    if chunk:
+                        yield bytes(chunk)
+            yield bytes(encoder.flush())
+        finally:
+            _unlink(wav_path)
+    
+    return generate()
+
+def _encode_mp3_ffmpeg(text):
+    """
+    `say` needs a seekable AIFF target, but ffmpeg encodes straight to its
+    stdout so the MP3 never touches disk and bytes flow as they are produced.
+    """
+    aiff_path = _temp_path(".aiff")
+    _say_to(aiff_path, [], text)
+    try:
+        ffmpeg = subprocess.Popen(
+            ["ffmpeg", "-loglevel", "error", "-f", "aiff", "-i", aiff_path, "-f", "mp3", "pipe:1"],
+            stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, bufsize=TTS_BUFSIZE
+        )
+    except BaseException:
+        _unlink(aiff_path)
+        raise
+    
+    def generate():
+        try:
+            for chunk in iter(lambda: ffmpeg.stdout.read(TTS_CHUNK), b""):
+                yield chunk
+        finally:
+            ffmpeg.stdout.close()
+            ffmpeg.wait()
+            _unlink(aiff_path)
+    
+    return generate()
+
+def synthesize_mp3(text):
+    """Speaks `text` with the Mac voice and streams it back as MP3."""
+    if lameenc is not None:
+        return _encode_mp3_lame(text)
+    return _encode_mp3_ffmpeg(text)
+
+# Streaming capture: the browser uploads a MediaRecorder chunk every 250 ms and
+# Whisper transcribes the growing recording in windows while the user speaks,
+# so at stop only the last window is left to decode.
+WHISPER_SAMPLE_RATE = 16000
+PARTIAL_EVERY_CHUNKS = 8                      # ~2 s of audio between partial passes
+WINDOW_OVERLAP = WHISPER_SAMPLE_RATE          # 1 s of already-transcribed audio re-fed per window
+PARTIAL_HOLDBACK = WHISPER_SAMPLE_RATE // 2   # segments ending this close to the edge wait for more audio
+SESSION_ID_RE = re.compile(r"^[A-Za-z0-9_-]{1,64}$")
+SESSION_TTL = 300                             # seconds without a chunk before a capture is abandoned
+
+# Whisper runs one window at a time
+whisper_pool = ThreadPoolExecutor(max_workers=1, thread_name_prefix="whisper")
+sessions = {}
+sessions_lock = threading.Lock()
+
+class CaptureSession:
+    def __init__(self, session_id):
+        self.path = os.path.join(SAVE_DIR, f"voice_{session_id}.webm")
+        self.chunks = 0
+        self.committed = 0      # samples already covered by self.parts
+        self.parts = []
+        self.pending = None     # in-flight partial transcription
+        self.last_seen = time.monotonic()
+        self.lock = threading.Lock()
+
+def evict_stale_sessions():
+    """Drops captures whose client stopped uploading without calling /command."""
+    cutoff = time.monotonic() - SESSION_TTL
+    with sessions_lock:
+        stale = [sid for sid, s in sessions.items()
+                 if s.last_seen < cutoff and (s.pending is None or s.pending.done())]
+        evicted = [sessions.pop(sid) for sid in stale]
+    for session in evicted:
+        try:
+            os.remove(session.path)
+        except FileNotFoundError:
+            pass
+
+def decode_pcm(path):
+    """Decodes the (possibly still growing) WebM to 16 kHz mono float32."""
+    raw = subprocess.run(
+        ["ffmpeg", "-loglevel", "error", "-i", path, "-f", "s16le", "-ac", "1",
+         "-ar", str(WHISPER_SAMPLE_RATE), "pipe:1"],
+        stdout=subprocess.PIPE, stderr=subprocess.DEVNULL
+    ).stdout
+    return np.frombuffer(raw, dtype=np.int16).astype(np.float32) / 32768.0
+
+def transcribe_window(session, final=False):
+    """Transcribes audio past session.committed, re-feeding WINDOW_OVERLAP for context."""
+    pcm = decode_pcm(session.path)
+    start = max(0, session.committed - WINDOW_OVERLAP)
+    if len(pcm) <= session.committed:
+        return
+    prompt = " ".join(session.parts)[-200:] or None
+    result = transcribe(pcm[start:], initial_prompt=prompt)
+    for seg in result.get("segments", []):
+        seg_end = start + int(seg["end"] * WHISPER_SAMPLE_RATE)
+        if seg_end <= session.committed:
+            continue  # inside the overlap: already transcribed
+        if not final and seg_end > len(pcm) - PARTIAL_HOLDBACK:
+            break     # may be cut mid-word; the next window covers it
+        session.parts.append(seg["text"].strip())
+        session.committed = seg_end
 HTML_TEMPLATE = """
 <!DOCTYPE html>
 <html>
@@ -41,18 +226,35 @@ HTML_TEMPLATE = """
     <script>
         const btn = document.getElementById('mic');
         const log = document.getElementById('log');
-        let chunks = [];
         let recorder = null;
+        let sessionId = null;
+        let uploads = Promise.resolve();
+
+        // Chunks are uploaded in order while recording so the server can transcribe as we speak
+        function upload(e) {
+            if (e.data.size === 0) return;
+            const sid = sessionId;
+            uploads = uploads.then(() => fetch('/chunk', { method: 'POST', headers: { 'X-Session-Id': sid }, body: e.data }));
+        }
+
+        function begin(e) {
+            e.preventDefault();
+            sessionId = Date.now().toString(36) + Math.random().toString(36).slice(2, 10);
+            uploads = Promise.resolve();
+            recorder.start(250);
+            btn.classList.add('recording');
+            log.innerText = "Recording...";
+        }
 
         async function start() {
             try {
                 const stream = await navigator.mediaDevices.getUserMedia({ audio: true });
                 recorder = new MediaRecorder(stream);
-                recorder.ondataavailable = e => chunks.push(e.data);
+                recorder.ondataavailable = upload;
                 recorder.onstop = send;
                 
-                btn.ontouchstart = (e) => { e.preventDefault(); chunks=[]; recorder.start(); btn.classList.add('recording'); log.innerText = "Recording..."; };
-                btn.onmousedown = (e) => { e.preventDefault(); chunks=[]; recorder.start(); btn.classList.add('recording'); log.innerText = "Recording..."; };
+                btn.ontouchstart = begin;
+                btn.onmousedown = begin;
                 
                 const stop = (e) => { e.preventDefault(); if(recorder.state === 'recording') recorder.stop(); btn.classList.remove('recording'); log.innerText = "Sending..."; };
                 btn.onmouseup = stop;
@@ -66,14 +268,10 @@ HTML_TEMPLATE = """
 
 
         async function send() {
-            if (chunks.length === 0) return;
-            const blob = new Blob(chunks, { type: 'audio/webm' });
-            const fd = new FormData();
-            fd.append('audio', blob, 'cmd.webm');
-            
             try {
+                await uploads;
                 log.innerText = "Thinking...";
-                const res = await fetch('/command', { method: 'POST', body: fd });
+                const res = await fetch('/command', { method: 'POST', headers: { 'X-Session-Id': sessionId } });
                 
                 if (res.headers.get("content-type") === "audio/mpeg") {
                     log.innerText = "Speaking...";
@@ -102,27 +300,58 @@ HTML_TEMPLATE = """
 def index():
     return HTML_TEMPLATE
 
+@app.route('/chunk', methods=['POST'])
+def chunk():
+    """Appends one MediaRecorder chunk and periodically kicks off a partial transcription."""
+    session_id = request.headers.get('X-Session-Id', '')
+    if not SESSION_ID_RE.match(session_id):
+        return "Bad session", 400
+    with sessions_lock:
+        session = sessions.get(session_id)
+        created = session is None
+        if created:
+            session = sessions[session_id] = CaptureSession(session_id)
+    if created:
+        evict_stale_sessions()
+    
+    with session.lock:
+        with open(session.path, "ab") as f:
+            f.write(request.get_data())
+        session.chunks += 1
+        session.last_seen = time.monotonic()
+        idle = session.pending is None or session.pending.done()
+        if idle and session.chunks % PARTIAL_EVERY_CHUNKS == 0:
+            session.pending = whisper_pool.submit(transcribe_window, session)
+    return "", 204
+
 @app.route('/command', methods=['POST'])
 def command():
     print("⟡ Audio Signal Received")
-    if 'audio' not in request.files:
+    session_id = request.headers.get('X-Session-Id', '')
+    with sessions_lock:
+        session = sessions.pop(session_id, None)
+    if session is None and 'audio' not in request.files:
         return "No audio", 400
     
-    file = request.files['audio']
-    path = os.path.join(SAVE_DIR, "voice_command.webm")
-    file.save(path)
-    
     # 1. Transcribe (Whisper)
     print("Transcribing...")
     try:
-        if USE_MLX:
-            # MLX Whisper
-            result = mlx_whisper.transcribe(path, path_or_hf_repo="mlx-community/whisper-large-v3-turbo")
-            text = result["text"].strip()
+        if session is not None:
+            # Streamed capture: only the audio after the last partial window is left
+            with session.lock:
+                pending = session.pending
+            if pending is not None:
+                pending.exception()  # wait; a failed partial is simply redone by the final pass
+            whisper_pool.submit(transcribe_window, session, True).result()
+            text = " ".join(p for p in session.parts if p).strip()
         else:
-            # CPU Whisper
-            result = model.transcribe(path)
-            text = result["text"].strip()
+            # Whole-file upload (per-request path: concurrent commands must not clobber each other)
+            path = _temp_path(".webm", prefix="voice_command_")
+            try:
+                request.files['audio'].save(path)
+                text = transcribe(path)["text"].strip()
+            finally:
+                _unlink(path)
             
         print(f"Heard: {text}")
         
@@ -130,7 +359,7 @@ def command():
         
         # 2. Intelligence (Ollama Phi-4)
         print(f"Asking Phi-4: {text}")
-        r = requests.post('http://localhost:11434/api/generate', 
+        r = ollama_session.post(OLLAMA_GENERATE_URL,
             json={'model': 'phi4:latest', 'prompt': text, 'stream': False})
         
         if r.status_code == 200:
@@ -138,36 +367,21 @@ def command():
             print(f"Answer: {ans[:50]}...")
             
             # Generate Mac Voice Audio
-            # Clean up text for 'say'
-            clean_ans = ans.replace('"', '').replace("'", "")
-            subprocess.run(f"say -o {SAVE_DIR}/response.aiff '{clean_ans}'", shell=True)
-            # Convert to mp3 for browser compatibility
-            subprocess.run(f"ffmpeg -y -i {SAVE_DIR}/response.aiff {SAVE_DIR}/response.mp3", shell=True, stderr=subprocess.DEVNULL)
-            
-            return send_file(f"{SAVE_DIR}/response.mp3", mimetype="audio/mpeg")
+            # The answer goes to 'say' as its own argv element (no shell), so no quote stripping
+            # Stream as mp3 for browser compatibility
+            return Response(stream_with_context(synthesize_mp3(ans)), mimetype="audio/mpeg")
         else:
             return "My AI Brain is offline."
             
     except Exception as e:
         print(f"Error: {e}")
         return f"Error: {e}"
-
-if __name__ == '__main__':
-    print("⟡ MirrorBrain Cortex Web Interface Active on 5002...")
-    # SSL required for getUserMedia on non-localhost
-    print("⟡ Serving Securely (Tailscale Certs)...")
-    
-    # Paths to Tailscale Certs
-    CERT = "mirror-admins-mac-mini.taildfee74.ts.net.crt"
-    KEY = "mirror-admins-mac-mini.taildfee74.ts.net.key"
     
-    # Check if certs exist in current dir (where we ran the command) or ~/.mirrordna
-    # We ran it in ~/.mirrordna via cwd
-    BASE = "/Users/mirror-admin/.mirrordna"
-    CERT_PATH = os.path.join(BASE, CERT)
-    KEY_PATH = os.path.join(BASE, KEY)
-    
-    # SSL handled by Tailscale Serve (TLS Termination)
-    # We listen on HTTP 5002, Tailscale proxies HTTPS 443 -> HTTP 5002
-    print("⟡ Serving internally on 5002 (Tailscale will wrap this)...")
-    app.run(host='0.0.0.0', port=5002)
+    finally:
+        if session is not None:
+            try:
+                os.remove(session.path)
+            except FileNotFoundError:
+                pass
+
+# Served by gunicorn (see gunicorn_cortex.conf.py / run_cortex.sh), not app.run().
@@ -0,0 +1,32 @@
+"""
+Gunicorn config for the Cortex Bridge (spine/cortex_bridge.py).
+
+Usage (from spine/):
+    gunicorn -c gunicorn_cortex.conf.py cortex_bridge:app
+
+Tailscale Serve terminates TLS and proxies HTTPS 443 -> HTTP 5002.
+"""
+
+bind = "0.0.0.0:5002"
+
+# One process, many threads: /chunk uploads for a capture session must reach the
+# worker holding that session, and Whisper already serializes on its own pool.
+# Threads overlap the rest (uploads, Ollama waits, say/ffmpeg subprocesses).
+worker_class = "gthread"
+workers = 1
+threads = 8
+
+# No preload: the worker imports the app itself, so Whisper loads and warms
+# inside it (before it accepts requests) and no model state crosses a fork.
+preload_app = False
+
+# Whisper + Ollama + TTS can exceed gunicorn's 30 s default for long utterances
+timeout = 180
+graceful_timeout = 30
+keepalive = 5
+
+def post_fork(server, worker):
+    server.log.info("⟡ Cortex worker %s forked; loading Whisper...", worker.pid)
+
+def post_worker_init(worker):
+    worker.log.info("⟡ Cortex worker %s warm, accepting voice commands.", worker.pid)
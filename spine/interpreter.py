@@ -8,6 +8,10 @@ input -> vam -> context -> decoder -> prompt
 """
 
 import time
+import logging
+import threading
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, Any, List
 from .vam import VaultAttentionMechanism
 from .types import SymbioticMemory, MemoryRights
@@ -15,14 +19,44 @@ from codec.universal_decoder import UniversalDecoder
 from scd.black_box import BlackBoxLogger
 from .nervous_system import NervousSystem
 
+# Background writers for memory commits and Black Box logging
+COMMIT_WORKERS = 2
+# Queued memory commits beyond this drop the oldest not-yet-started one
+# (Black Box log writes are never shed)
+MAX_PENDING_COMMITS = 64
+
+logger = logging.getLogger(__name__)
+
 class SymbioticInterpreter:
     def __init__(self):
         self.vam = VaultAttentionMechanism()
         self.decoder = UniversalDecoder()
         self.logger = BlackBoxLogger()
         self.nervous_system = NervousSystem()
+        # Learning writes (encode + Chroma add + log append) run off the request path
+        self._io_pool = ThreadPoolExecutor(max_workers=COMMIT_WORKERS, thread_name_prefix="spine-commit")
+        self._pending_commits = deque()
+        self._pending_lock = threading.Lock()
         print("⟡ Symbiotic Interpreter Online.")
 
+    def _submit_commit(self, content: str, rights: str):
+        """Queues commit_memory on the pool, shedding the oldest queued commit on overflow."""
+        dropped = False
+        with self._pending_lock:
+            while self._pending_commits and self._pending_commits[0].done():
+                self._pending_commits.popleft()
+            if len(self._pending_commits) >= MAX_PENDING_COMMITS:
+                for future in self._pending_commits:
+                    if future.cancel():
+                        self._pending_commits.remove(future)
+                        dropped = True
+                        break
+            future = self._io_pool.submit(self.commit_memory, content, rights)
+            self._pending_commits.append(future)
+        if dropped:
+            logger.warning("Commit queue full: dropped oldest pending memory commit")
+        return future
+
     def process(self, user_input: str) -> str:
         """
         The Thinking Loop.
@@ -60,10 +94,13 @@ class SymbioticInterpreter:
             
             # 2. Learn from Consequence
             # We commit the action and result to memory so the AI learns what happens.
+            # Both writes are queued so the response is not held up by disk/index I/O.
             learn_content = f"ACTION: {cmd}\nRESULT ({code}): {output[:500]}"
-            self.commit_memory(learn_content, "system_ephemeral")
+            self._submit_commit(learn_content, "system_ephemeral")
             
-            self.logger.log_transition(
+            # Audit entries are never shed: the hash chain must record every EXECUTE
+            self._io_pool.submit(
+                self.logger.log_transition,
                 context={"cmd": cmd, "code": code},
                 action="EXECUTE",
                 result="SUCCESS" if code == 0 else "FAIL"
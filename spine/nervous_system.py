@@ -7,11 +7,15 @@ The Autonomic Nervous System allows the Symbiotic Spine to affect the physical w
 It interprets `⟡⟦EXEC: <cmd>⟧` tags from the Model execution stream.
 """
 
+import re
 import subprocess
 import shlex
 from typing import Tuple
 from .memory_rights import MemoryRightsProtocol, SymbioticMemory
 
+# Compiled once; scanned against every model response
+_EXEC_RE = re.compile(r"⟡⟦EXEC:\s*(.*?)⟧")
+
 class NervousSystem:
     def __init__(self):
         print("⟡ Nervous System Online. (Motor Control Active)")
@@ -47,8 +51,7 @@ class NervousSystem:
         """
         Parses the model output for ⟡⟦EXEC: ...⟧ patterns.
         """
-        import re
-        match = re.search(r"⟡⟦EXEC:\s*(.*?)⟧", response_text)
+        match = _EXEC_RE.search(response_text)
         if match:
             return match.group(1).strip()
         return ""
@@ -9,13 +9,24 @@ Intercepts Chat Completions, Injects Symbiotic Context, and Proxies to Ollama.
 
 from fastapi import FastAPI, Request
 from fastapi.responses import StreamingResponse, JSONResponse
-import requests
+from starlette.background import BackgroundTask
+import httpx
 import json
 import uvicorn
 from contextlib import asynccontextmanager
 
 from spine.interpreter import SymbioticInterpreter
 
+try:
+    import orjson
+    _loads = orjson.loads
+    _dumps = orjson.dumps
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(',', ':'), ensure_ascii=False).encode('utf-8')
+
 # Configuration
 OLLAMA_URL = "http://localhost:11434/v1/chat/completions"
 PROXY_PORT = 5500
@@ -23,13 +34,21 @@ PROXY_PORT = 5500
 # Global Interpreter
 interpreter = None
 
+# Shared async HTTP client (pooled keep-alive connections to Ollama)
+ollama_client = None
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
-    global interpreter
+    global interpreter, ollama_client
     print("⟡ OMEGA: Initializing Symbiotic Spine...")
     interpreter = SymbioticInterpreter()
+    ollama_client = httpx.AsyncClient(
+        timeout=None,
+        limits=httpx.Limits(max_connections=64)
+    )
     print("⟡ OMEGA: Spine Online.")
     yield
+    await ollama_client.aclose()
     print("⟡ OMEGA: Shutting Down.")
 
 app = FastAPI(lifespan=lifespan)
@@ -40,7 +59,7 @@ async def chat_completions(request: Request):
     The Core Symbiotic Injection Loop.
     """
     try:
-        body = await request.json()
+        body = _loads(await request.body())
         messages = body.get("messages", [])
         
         # 1. Extract User Input
@@ -94,15 +113,29 @@ async def chat_completions(request: Request):
         print(f"✕ OMEGA ERROR: {e}")
         return JSONResponse(status_code=500, content={"error": str(e)})
 
+async def iter_frames(resp):
+    """
+    Yields each upstream line as soon as it is complete, so every SSE/NDJSON
+    token frame reaches the client immediately instead of waiting for a
+    fixed-size chunk to fill.
+    """
+    async for line in resp.aiter_lines():
+        yield line + "\n"
+
 async def forward_to_ollama(json_body):
-    """Streams the response from Ollama back to the client."""
-    resp = requests.post(OLLAMA_URL, json=json_body, stream=True)
+    """Streams the response from Ollama back to the client without blocking the event loop."""
+    req = ollama_client.build_request(
+        "POST", OLLAMA_URL,
+        content=_dumps(json_body),
+        headers={"content-type": "application/json"}
+    )
+    resp = await ollama_client.send(req, stream=True)
     
-    def iter_content():
-        for chunk in resp.iter_content(chunk_size=1024):
-            yield chunk
-            
-    return StreamingResponse(iter_content(), media_type="application/json")
+    return StreamingResponse(
+        iter_frames(resp),
+        media_type="application/json",
+        background=BackgroundTask(resp.aclose)
+    )
 
 if __name__ == "__main__":
     uvicorn.run(app, host="0.0.0.0", port=PROXY_PORT)
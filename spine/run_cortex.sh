@@ -0,0 +1,8 @@
+#!/bin/bash
+# ⟡ Cortex Bridge — voice interface on 5002 (Tailscale wraps it in HTTPS)
+
+cd /Users/mirror-admin/Documents/MirrorDNA-Symbiosis/spine
+source ~/.zshrc 2>/dev/null
+
+echo "⟡ MirrorBrain Cortex Web Interface Active on 5002..."
+exec gunicorn -c gunicorn_cortex.conf.py cortex_bridge:app
@@ -10,7 +10,11 @@ Formula: Attention = (VectorSim * 0.5) + (TimeDecay * 0.3) + (GlyphPriority * 0.
 """
 
 import time
+import functools
+import threading
+from collections import OrderedDict
 import chromadb
+import numpy as np
 from typing import List, Dict, Any
 from datetime import datetime
 from sentence_transformers import SentenceTransformer
@@ -21,81 +25,336 @@ WEIGHT_VECTOR = 0.5
 WEIGHT_TIME = 0.3
 WEIGHT_GLYPH = 0.2
 
+# 1 / (7 days in seconds), folded once for the decay term
+INV_DECAY_SECONDS = 1.0 / 604800
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
+
+try:
+    import faiss
+except ImportError:
+    faiss = None
+
+def _unified_scores_numpy(distances, created_at, has_glyph, now):
+    """Returns (final, vector, time_decay, glyph) score arrays."""
+    # Vector Similarity (1 - distance for cosine approx)
+    vector_scores = 1.0 - distances
+    # Time Decay: 1.0 at creation, decays to 0.5 over 7 days
+    time_decay = 1.0 / (1.0 + (now - created_at) * INV_DECAY_SECONDS)
+    # Glyph Boost
+    glyph_scores = np.where(has_glyph, 1.0, 0.5)
+    final_scores = (vector_scores * WEIGHT_VECTOR) + \
+                   (time_decay * WEIGHT_TIME) + \
+                   (glyph_scores * WEIGHT_GLYPH)
+    return final_scores, vector_scores, time_decay, glyph_scores
+
+if njit is not None:
+    @njit(cache=True, fastmath=True)
+    def _unified_scores_kernel(distances, created_at, has_glyph, now, wv, wt, wg, inv_decay):
+        n = distances.shape[0]
+        final_scores = np.empty(n)
+        vector_scores = np.empty(n)
+        time_decay = np.empty(n)
+        glyph_scores = np.empty(n)
+        for i in range(n):
+            v = 1.0 - distances[i]
+            t = 1.0 / (1.0 + (now - created_at[i]) * inv_decay)
+            g = 1.0 if has_glyph[i] else 0.5
+            vector_scores[i] = v
+            time_decay[i] = t
+            glyph_scores[i] = g
+            final_scores[i] = v * wv + t * wt + g * wg
+        return final_scores, vector_scores, time_decay, glyph_scores
+
+    def _unified_scores(distances, created_at, has_glyph, now):
+        return _unified_scores_kernel(distances, created_at, has_glyph, now,
+                                      WEIGHT_VECTOR, WEIGHT_TIME, WEIGHT_GLYPH, INV_DECAY_SECONDS)
+
+    # Compile at import (cached on disk) so no request pays the JIT cost
+    _unified_scores(np.zeros(1), np.zeros(1), np.zeros(1, dtype=np.bool_), 0.0)
+else:
+    _unified_scores = _unified_scores_numpy
+
+# Embedding Config
+QUERY_CACHE_SIZE = 4096
+ENCODE_BATCH_SIZE = 32
+
+# Candidate caches in front of the vector search, dropped whenever memories are added:
+# an exact LRU keyed by query text, then a ring of recent int8 query vectors whose
+# candidates are reused for any query within SEMANTIC_CACHE_THRESHOLD cosine.
+SEARCH_CACHE_SIZE = 256
+SEMANTIC_CACHE_SIZE = 64
+SEMANTIC_CACHE_THRESHOLD = 0.98
+
+# In-process FAISS mirror of the Chroma collection (Chroma stays the durable store).
+# IVF-PQ needs enough vectors to train its coarse quantizer; smaller vaults use exact
+# L2 over int8 scalar-quantized codes.
+IVF_NLIST = 256
+IVF_NPROBE = 16
+PQ_M = 16
+PQ_NBITS = 8
+IVF_MIN_TRAIN = IVF_NLIST * 39
+# Mirror vectors are unit-norm embeddings snapped to the int8 grid (v * 127);
+# search distances are divided by INT8_SCALE**2 to stay comparable with Chroma's.
+INT8_SCALE = 127.0
+
+def _to_int8_grid(vectors: np.ndarray) -> np.ndarray:
+    """Rounds unit-norm float vectors to int8 code points (kept as float32 for FAISS)."""
+    return np.clip(np.rint(vectors * INT8_SCALE), -INT8_SCALE, INT8_SCALE).astype(np.float32)
+
+def _side_rows(metadatas) -> np.ndarray:
+    """(n, 2) float64 rows of (created_at or NaN, glyph flag) for the scoring side table."""
+    side = np.empty((len(metadatas), 2), dtype=np.float64)
+    for i, m in enumerate(metadatas):
+        side[i, 0] = m.get('created_at', np.nan)
+        side[i, 1] = 1.0 if "⟡" in m.get('glyphs', "") else 0.0
+    return side
+
+def _new_exact_index(dim: int):
+    """Exact L2 search over 1-byte-per-dimension codes; needs no training."""
+    return faiss.IndexScalarQuantizer(dim, faiss.ScalarQuantizer.QT_8bit_direct_signed, faiss.METRIC_L2)
+
+# One embedder per model and one Chroma client per vault path, shared by every
+# VAM in the process. Loaded before a pre-fork server forks, the weights are
+# shared copy-on-write by all workers instead of being reloaded per instance.
+_EMBEDDERS: Dict[str, SentenceTransformer] = {}
+_CLIENTS: Dict[str, Any] = {}
+_SHARED_LOCK = threading.Lock()
+
+def _get_embedder(model_name: str) -> SentenceTransformer:
+    with _SHARED_LOCK:
+        embedder = _EMBEDDERS.get(model_name)
+        if embedder is None:
+            embedder = _EMBEDDERS[model_name] = SentenceTransformer(model_name)
+        return embedder
+
+def _get_client(vault_path: str):
+    with _SHARED_LOCK:
+        client = _CLIENTS.get(vault_path)
+        if client is None:
+            client = _CLIENTS[vault_path] = chromadb.PersistentClient(path=vault_path)
+        return client
+
 class VaultAttentionMechanism:
     def __init__(self, vault_path: str = "./vectors", model_name: str = "all-MiniLM-L6-v2"):
-        self.chroma_client = chromadb.PersistentClient(path=vault_path)
+        self.chroma_client = _get_client(vault_path)
         self.collection = self.chroma_client.get_or_create_collection(name="symbiotic_spine")
-        self.embedder = SentenceTransformer(model_name)
+        self.embedder = _get_embedder(model_name)
+        # Repeated queries skip the transformer forward pass entirely
+        self._encode_query = functools.lru_cache(maxsize=QUERY_CACHE_SIZE)(self._encode)
+        self._index_lock = threading.Lock()
+        self._index = None
+        self._cache_lock = threading.Lock()
+        # Bumped by every cache clear; results computed under an older one are not stored
+        self._cache_generation = 0
+        self._clear_search_cache()
+        if faiss is not None:
+            self._build_index()
         print(f"⟡ VAM Online: {model_name} loaded.")
 
+    def _build_index(self):
+        """
+        Rebuilds the FAISS mirror from Chroma. Row i of the index is self._ids[i],
+        and self._side[i] holds its (created_at, glyph) scoring fields.
+        """
+        stored = self.collection.get(include=["embeddings", "documents", "metadatas"])
+        vectors = _to_int8_grid(np.asarray(stored['embeddings'], dtype=np.float32))
+        self._ids = list(stored['ids'])
+        self._documents = list(stored['documents'])
+        self._side = _side_rows(stored['metadatas'])
+        self._rows = {vault_id: i for i, vault_id in enumerate(self._ids)}
+        
+        if len(self._ids) >= IVF_MIN_TRAIN:
+            dim = vectors.shape[1]
+            index = faiss.IndexIVFPQ(faiss.IndexFlatL2(dim), dim, IVF_NLIST, PQ_M, PQ_NBITS)
+            index.train(vectors)
+            index.nprobe = IVF_NPROBE
+        elif self._ids:
+            index = _new_exact_index(vectors.shape[1])
+        else:
+            index = None  # dimension unknown until the first memory arrives
+        if index is not None:
+            index.add(vectors)
+        self._index = index
+
+    def _mirror_add(self, ids, embeddings, documents, metadatas):
+        """Appends newly committed memories to the FAISS mirror."""
+        with self._index_lock:
+            fresh = [i for i, vault_id in enumerate(ids) if vault_id not in self._rows]
+            if not fresh:
+                return
+            vectors = _to_int8_grid(np.asarray([embeddings[i] for i in fresh], dtype=np.float32))
+            if self._index is None:
+                self._index = _new_exact_index(vectors.shape[1])
+            start, end = len(self._ids), len(self._ids) + len(fresh)
+            if end > self._side.shape[0]:
+                # Grow geometrically so appends stay amortized O(1)
+                side = np.empty((max(end, 2 * self._side.shape[0]), 2), dtype=np.float64)
+                side[:start] = self._side[:start]
+                self._side = side
+            self._side[start:end] = _side_rows([metadatas[i] for i in fresh])
+            for i in fresh:
+                self._rows[ids[i]] = len(self._ids)
+                self._ids.append(ids[i])
+                self._documents.append(documents[i])
+            self._index.add(vectors)
+
+    def _clear_search_cache(self):
+        with self._cache_lock:
+            self._cache_generation += 1
+            self._exact_cache: "OrderedDict[tuple, tuple]" = OrderedDict()
+            self._semantic_vecs = None  # (SEMANTIC_CACHE_SIZE, dim) int8, allocated on first use
+            self._semantic_norms = np.zeros(SEMANTIC_CACHE_SIZE, dtype=np.float32)
+            self._semantic_entries = [None] * SEMANTIC_CACHE_SIZE  # (n_results, candidates)
+            self._semantic_next = 0
+
+    def _cached_candidates(self, query: str, n_results: int):
+        """_search() behind the exact and semantic caches."""
+        key = (query, n_results)
+        with self._cache_lock:
+            generation = self._cache_generation
+            hit = self._exact_cache.get(key)
+            if hit is not None:
+                self._exact_cache.move_to_end(key)
+                return hit
+        
+        query_vec = list(self._encode_query(query))
+        q8 = _to_int8_grid(np.asarray(query_vec, dtype=np.float32)).astype(np.int8)
+        q_norm = float(np.linalg.norm(q8.astype(np.float32)))
+        
+        candidates = None
+        with self._cache_lock:
+            if self._semantic_vecs is not None and q_norm > 0:
+                sims = (self._semantic_vecs.astype(np.int32) @ q8.astype(np.int32)) / \
+                       np.maximum(self._semantic_norms * q_norm, 1e-9)
+                for slot in np.argsort(-sims):
+                    entry = self._semantic_entries[slot]
+                    if sims[slot] < SEMANTIC_CACHE_THRESHOLD:
+                        break
+                    if entry is not None and entry[0] == n_results:
+                        candidates = entry[1]
+                        break
+        
+        if candidates is None:
+            candidates = self._search(query_vec, n_results)
+            with self._cache_lock:
+                if self._cache_generation != generation:
+                    # add_memories cleared the cache mid-search: this result may predate it
+                    return candidates
+                if self._semantic_vecs is None:
+                    self._semantic_vecs = np.zeros((SEMANTIC_CACHE_SIZE, q8.shape[0]), dtype=np.int8)
+                slot = self._semantic_next
+                self._semantic_vecs[slot] = q8
+                self._semantic_norms[slot] = q_norm
+                self._semantic_entries[slot] = (n_results, candidates)
+                self._semantic_next = (slot + 1) % SEMANTIC_CACHE_SIZE
+        
+        with self._cache_lock:
+            if self._cache_generation != generation:
+                return candidates
+            self._exact_cache[key] = candidates
+            if len(self._exact_cache) > SEARCH_CACHE_SIZE:
+                self._exact_cache.popitem(last=False)
+        return candidates
+
+    def _encode(self, text: str) -> tuple:
+        return tuple(self.embedder.encode(text, normalize_embeddings=True).tolist())
+
     def add_memory(self, memory: SymbioticMemory):
         """Index a memory into the vector spine."""
-        embedding = self.embedder.encode(memory.content).tolist()
+        self.add_memories([memory])
+
+    def add_memories(self, memories: List[SymbioticMemory]):
+        """Index several memories with one batched encode and one collection write."""
+        if not memories:
+            return
         
-        # Determine active glyphs
-        active_glyphs = [g for g in ["⟡", "❖", "◈"] if g in memory.content]
+        texts = [m.content for m in memories]
+        embeddings = self.embedder.encode(texts, batch_size=ENCODE_BATCH_SIZE, show_progress_bar=False,
+                                       normalize_embeddings=True).tolist()
         
-        self.collection.add(
-            ids=[memory.vault_id],
-            embeddings=[embedding],
-            documents=[memory.content],
-            metadatas=[{
+        metadatas = []
+        for memory in memories:
+            # Determine active glyphs
+            active_glyphs = [g for g in ["⟡", "❖", "◈"] if g in memory.content]
+            metadatas.append({
                 "created_at": memory.created_at,
                 "rights": memory.rights.value,
                 "glyphs": ",".join(active_glyphs)
-            }]
+            })
+        
+        ids = [m.vault_id for m in memories]
+        self.collection.add(
+            ids=ids,
+            embeddings=embeddings,
+            documents=texts,
+            metadatas=metadatas
         )
+        if faiss is not None:
+            self._mirror_add(ids, embeddings, texts, metadatas)
+        # Cached candidate sets may now miss the new memories
+        self._clear_search_cache()
 
-    def retrieve_context(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+    def _search(self, query_vec: List[float], n_results: int):
         """
-        Retrieves context using the Unified Attention Formula.
+        Returns (ids, distances, side, documents) for the nearest candidates, where
+        side is the (n, 2) array of (created_at or NaN, glyph flag) per candidate.
         """
-        query_vec = self.embedder.encode(query).tolist()
-        current_time = datetime.now().timestamp()
+        if faiss is not None:
+            with self._index_lock:
+                if self._index is None or self._index.ntotal == 0:
+                    return [], [], None, []
+                # The int8 index truncates float queries, so snap to the grid ourselves
+                query = _to_int8_grid(np.asarray([query_vec], dtype=np.float32))
+                distances, rows = self._index.search(query, n_results)
+                keep = rows[0] >= 0
+                rows = rows[0][keep]
+                # Scoring fields come from the aligned side table, not per-candidate dicts
+                return ([self._ids[r] for r in rows], distances[0][keep] / (INT8_SCALE * INT8_SCALE),
+                        self._side[rows], [self._documents[r] for r in rows])
         
-        # 1. Fetch Candidates (Broad Vector Search)
         results = self.collection.query(
             query_embeddings=[query_vec],
-            n_results=top_k * 3 # Fetch extra to re-rank
+            n_results=n_results
         )
-        
         if not results['ids']:
+            return [], [], None, []
+        return results['ids'][0], results['distances'][0], _side_rows(results['metadatas'][0]), results['documents'][0]
+
+    def retrieve_context(self, query: str, top_k: int = 5) -> List[Dict[str, Any]]:
+        """
+        Retrieves context using the Unified Attention Formula.
+        """
+        current_time = datetime.now().timestamp()
+        
+        # 1. Fetch Candidates (Broad Vector Search, cached; scores are always recomputed)
+        ids, distances, side, documents = self._cached_candidates(query, top_k * 3) # Fetch extra to re-rank
+        
+        if not ids:
             return []
+        n = len(ids)
 
-        candidates = []
-        ids = results['ids'][0]
-        distances = results['distances'][0]
-        metadatas = results['metadatas'][0]
-        documents = results['documents'][0]
-
-        for i, vault_id in enumerate(ids):
-            # 2. Compute Components
-            # Vector Similarity (1 - distance for cosine approx)
-            vector_score = 1.0 - distances[i] 
-            
-            # Time Decay: 1.0 at creation, decays to 0.5 over 7 days
-            created_at = metadatas[i].get('created_at', current_time)
-            age_seconds = current_time - created_at
-            time_decay = 1.0 / (1.0 + (age_seconds / 604800)) # 7 days decay half-life
-            
-            # Glyph Boost
-            glyphs = metadatas[i].get('glyphs', "")
-            glyph_score = 1.0 if "⟡" in glyphs else 0.5
-            
-            # 3. Unified Score
-            final_score = (vector_score * WEIGHT_VECTOR) + \
-                          (time_decay * WEIGHT_TIME) + \
-                          (glyph_score * WEIGHT_GLYPH)
-            
-            candidates.append({
-                'vault_id': vault_id,
-                'content': documents[i],
-                'score': final_score,
-                'vector_score': vector_score,
-                'time_score': time_decay,
-                'glyph_score': glyph_score
-            })
-            
-        # 4. Re-Rank and Return
-        candidates.sort(key=lambda x: x['score'], reverse=True)
-        return candidates[:top_k]
+        # 2. Compute Components (one vector op per side-table column)
+        distances = np.asarray(distances, dtype=np.float64)
+        created_at = np.where(np.isnan(side[:, 0]), current_time, side[:, 0])
+        has_glyph = side[:, 1] > 0.0
+        
+        # 3. Unified Score (JIT kernel when numba is installed)
+        final_scores, vector_scores, time_decay, glyph_scores = _unified_scores(distances, created_at, has_glyph, current_time)
+        
+        # 4. Re-Rank: partial select of top_k, then order only the survivors
+        k = min(top_k, n)
+        top = np.argpartition(-final_scores, k - 1)[:k] if k < n else np.arange(n)
+        top = top[np.argsort(-final_scores[top], kind='stable')]
+        
+        return [{
+            'vault_id': ids[i],
+            'content': documents[i],
+            'score': float(final_scores[i]),
+            'vector_score': float(vector_scores[i]),
+            'time_score': float(time_decay[i]),
+            'glyph_score': float(glyph_scores[i])
+        } for i in top]
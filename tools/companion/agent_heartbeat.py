@@ -19,9 +19,15 @@ For: Paul
 import os
 import sys
 import json
+import time
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 HOME = Path.home()
 COMPANION_DIR = HOME / ".mirrordna" / "companion"
 HEARTBEAT_FILE = COMPANION_DIR / "agent_heartbeat.json"
@@ -34,7 +40,8 @@ def load_heartbeats() -> dict:
     """Load current heartbeat state."""
     if HEARTBEAT_FILE.exists():
         try:
-            return json.loads(HEARTBEAT_FILE.read_text())
+            raw = HEARTBEAT_FILE.read_bytes()
+            return orjson.loads(raw) if orjson else json.loads(raw)
         except:
             pass
     return {"agents": {}, "last_updated": None}
@@ -44,17 +51,27 @@ def save_heartbeats(data: dict):
     """Save heartbeat state."""
     data["last_updated"] = datetime.now().isoformat()
     COMPANION_DIR.mkdir(parents=True, exist_ok=True)
-    HEARTBEAT_FILE.write_text(json.dumps(data, indent=2))
+    if orjson:
+        payload = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    else:
+        payload = json.dumps(data, indent=2).encode("utf-8")
+    # Write-then-rename so readers never see a torn file
+    tmp = HEARTBEAT_FILE.with_suffix(".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, HEARTBEAT_FILE)
 
 
 def start_session(agent: str, task: str = ""):
     """Mark an agent as active."""
     data = load_heartbeats()
+    now_ts = time.time()
+    now_iso = datetime.fromtimestamp(now_ts).isoformat()
     data["agents"][agent] = {
         "status": "active",
-        "started_at": datetime.now().isoformat(),
+        "started_at": now_iso,
         "task": task[:200] if task else "Working",
-        "last_heartbeat": datetime.now().isoformat()
+        "last_heartbeat": now_iso,
+        "last_heartbeat_ts": now_ts
     }
     save_heartbeats(data)
     print(f"⟡ {agent} session started")
@@ -64,7 +81,9 @@ def pulse_session(agent: str, task: str = None):
     """Update heartbeat for an active session."""
     data = load_heartbeats()
     if agent in data["agents"]:
-        data["agents"][agent]["last_heartbeat"] = datetime.now().isoformat()
+        now_ts = time.time()
+        data["agents"][agent]["last_heartbeat"] = datetime.fromtimestamp(now_ts).isoformat()
+        data["agents"][agent]["last_heartbeat_ts"] = now_ts
         if task:
             data["agents"][agent]["task"] = task[:200]
         save_heartbeats(data)
@@ -86,7 +105,7 @@ def stop_session(agent: str, summary: str = ""):
 def get_status(compact: bool = False) -> str:
     """Get current agent status."""
     data = load_heartbeats()
-    now = datetime.now()
+    now = time.time()
     
     lines = []
     active_agents = []
@@ -95,11 +114,12 @@ def get_status(compact: bool = False) -> str:
         status = info.get("status", "unknown")
         
         if status == "active":
-            # Check if stale
-            last_hb = info.get("last_heartbeat")
-            if last_hb:
-                last_dt = datetime.fromisoformat(last_hb)
-                age_min = (now - last_dt).total_seconds() / 60
+            # Check if stale (epoch field; ISO string is for humans and legacy entries)
+            last_ts = info.get("last_heartbeat_ts")
+            if last_ts is None and info.get("last_heartbeat"):
+                last_ts = datetime.fromisoformat(info["last_heartbeat"]).timestamp()
+            if last_ts is not None:
+                age_min = (now - last_ts) / 60
                 if age_min > STALE_THRESHOLD:
                     status = "stale"
                     info["status"] = "stale"
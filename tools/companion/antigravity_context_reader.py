@@ -22,46 +22,76 @@ For: Paul
 import os
 import sys
 import json
+import time
+import hashlib
 from datetime import datetime, timedelta
 from pathlib import Path
 
+try:
+    from orjson import loads as _loads
+except ImportError:
+    _loads = json.loads
+
 HOME = Path.home()
 COMPANION_DIR = HOME / ".mirrordna" / "companion"
 WARM_CONTEXT = COMPANION_DIR / "warm_context.json"
 CROSS_AGENT = COMPANION_DIR / "cross_agent_memory.json"
 HEARTBEAT = COMPANION_DIR / "agent_heartbeat.json"
 
+# Parsed files keyed by path: (mtime, size, digest, data). Unchanged files are
+# not re-read; touched-but-identical files are re-read but not re-parsed.
+_JSON_CACHE = {}
+
 
 def load_json(path: Path) -> dict:
-    """Load JSON file safely."""
-    if path.exists():
-        try:
-            return json.loads(path.read_text())
-        except:
-            pass
-    return {}
+    """Load JSON file safely (cached until its mtime or content changes)."""
+    try:
+        st = path.stat()
+    except OSError:
+        return {}
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        return cached[3]
+    try:
+        raw = path.read_bytes()
+    except OSError:
+        return {}
+    digest = hashlib.blake2b(raw, digest_size=16).digest()
+    if cached and cached[2] == digest:
+        # The daemon touches warm_context.json when its content is unchanged
+        _JSON_CACHE[path] = (st.st_mtime, st.st_size, digest, cached[3])
+        return cached[3]
+    try:
+        data = _loads(raw)
+    except:
+        return {}
+    _JSON_CACHE[path] = (st.st_mtime, st.st_size, digest, data)
+    return data
 
 
 def is_fresh(path: Path, max_age_minutes: int = 10) -> bool:
     """Check if file was modified recently."""
-    if not path.exists():
+    try:
+        mtime = path.stat().st_mtime
+    except OSError:
         return False
-    age = datetime.now().timestamp() - path.stat().st_mtime
-    return age < (max_age_minutes * 60)
+    return time.time() - mtime < (max_age_minutes * 60)
 
 
-def get_paul_state() -> dict:
+def get_paul_state(data: dict = None) -> dict:
     """Get Paul's current state from warm context."""
     if not is_fresh(WARM_CONTEXT, 10):
         return {}
     
-    data = load_json(WARM_CONTEXT)
+    if data is None:
+        data = load_json(WARM_CONTEXT)
     return data.get("paul_state", {})
 
 
-def get_ambient() -> str:
+def get_ambient(data: dict = None) -> str:
     """Get ambient notes."""
-    data = load_json(WARM_CONTEXT)
+    if data is None:
+        data = load_json(WARM_CONTEXT)
     return data.get("ambient_notes", "")
 
 
@@ -72,15 +102,16 @@ def get_active_agents() -> list:
     
     data = load_json(HEARTBEAT)
     active = []
-    now = datetime.now()
+    now = time.time()
     
     for agent, info in data.get("agents", {}).items():
         if info.get("status") == "active":
-            # Check staleness
-            last_hb = info.get("last_heartbeat")
-            if last_hb:
-                last_dt = datetime.fromisoformat(last_hb)
-                if (now - last_dt).total_seconds() < 900:  # 15 min
+            # Check staleness (epoch field; ISO string only for legacy entries)
+            last_ts = info.get("last_heartbeat_ts")
+            if last_ts is None and info.get("last_heartbeat"):
+                last_ts = datetime.fromisoformat(info["last_heartbeat"]).timestamp()
+            if last_ts is not None:
+                if now - last_ts < 900:  # 15 min
                     active.append({
                         "name": agent,
                         "task": info.get("task", ""),
@@ -104,8 +135,9 @@ def get_last_handoff() -> dict:
 
 def generate_context(compact: bool = False) -> str:
     """Generate full context for Antigravity."""
-    paul = get_paul_state()
-    ambient = get_ambient()
+    warm = load_json(WARM_CONTEXT)
+    paul = get_paul_state(warm)
+    ambient = get_ambient(warm)
     active = get_active_agents()
     handoff = get_last_handoff()
     
@@ -20,9 +20,24 @@ For: Paul
 import os
 import sys
 import json
+import asyncio
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict
+from typing import Optional, Dict, List
+
+from jsonl_store import append_jsonl, compact_jsonl, migrate_legacy_log
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 # Paths
 HOME = Path.home()
@@ -31,7 +46,16 @@ MIRRORDNA = HOME / ".mirrordna"
 COMPANION_DIR = MIRRORDNA / "companion"
 CONTEXT_FILE = COMPANION_DIR / "warm_context.json"
 PENDING_QUERIES = COMPANION_DIR / "pending_queries.json"
-CONVERSATION_LOG = COMPANION_DIR / "conversations.json"
+CONVERSATION_LOG = COMPANION_DIR / "conversations.jsonl"
+LEGACY_CONVERSATION_LOG = COMPANION_DIR / "conversations.json"
+CONVERSATION_KEEP = 100
+CONVERSATION_LOG_MAX_BYTES = 1024 * 1024  # compact to the last CONVERSATION_KEEP beyond this
+
+# Claude request settings (Sonnet for speed in voice)
+CLAUDE_MODEL = "claude-sonnet-4-20250514"
+MAX_TOKENS = 1024
+# Pending queries in flight at once (rate-limit friendly)
+PENDING_QUERY_CONCURRENCY = 4
 
 # Identity kernel path
 IDENTITY_KERNEL = HOME / "Documents/GitHub/active-mirror-identity/ami_active-mirror.json"
@@ -40,35 +64,56 @@ IDENTITY_KERNEL = HOME / "Documents/GitHub/active-mirror-identity/ami_active-mir
 # CONTEXT LOADING
 # ═══════════════════════════════════════════════════════════════
 
+# Parsed files keyed by path: (mtime, size, data). Unchanged files are not re-read.
+_JSON_CACHE = {}
+
+
+def _load_json_cached(path: Path, default=None):
+    """Parse a JSON file, reusing the last result while its mtime and size are unchanged."""
+    try:
+        st = path.stat()
+    except OSError:
+        return default
+    cached = _JSON_CACHE.get(path)
+    if cached and cached[0] == st.st_mtime and cached[1] == st.st_size:
+        return cached[2]
+    try:
+        data = _loads(path.read_bytes())
+    except:
+        return default
+    _JSON_CACHE[path] = (st.st_mtime, st.st_size, data)
+    return data
+
+
 def load_warm_context() -> Dict:
     """Load warm context from companion daemon."""
-    if CONTEXT_FILE.exists():
-        try:
-            return json.loads(CONTEXT_FILE.read_text())
-        except:
-            pass
-    return {}
+    return _load_json_cached(CONTEXT_FILE, {})
 
 
 def load_identity_kernel() -> Dict:
     """Load Paul's identity kernel."""
-    if IDENTITY_KERNEL.exists():
-        try:
-            return json.loads(IDENTITY_KERNEL.read_text())
-        except:
-            pass
-    return {}
+    return _load_json_cached(IDENTITY_KERNEL, {})
 
 
 def load_recent_handoff() -> Optional[Dict]:
     """Load most recent handoff state."""
-    handoff_file = MIRRORDNA / "handoff.json"
-    if handoff_file.exists():
-        try:
-            return json.loads(handoff_file.read_text())
-        except:
-            pass
-    return None
+    return _load_json_cached(MIRRORDNA / "handoff.json")
+
+
+# Serialized identity section for the last kernel seen: [kernel_dict, text].
+# load_identity_kernel returns the same dict until the file changes, so an
+# identity check is enough to know the text is still current.
+_IDENTITY_BLOCK = [None, None]
+
+
+def _identity_block(identity: Dict) -> str:
+    """Indented JSON of the kernel's identity section, serialized once per kernel."""
+    if not identity:
+        return "Not loaded"
+    if _IDENTITY_BLOCK[0] is not identity:
+        _IDENTITY_BLOCK[1] = json.dumps(identity.get('identity', {}), indent=2)
+        _IDENTITY_BLOCK[0] = identity
+    return _IDENTITY_BLOCK[1]
 
 
 def build_system_prompt(context: Dict, identity: Dict) -> str:
@@ -90,7 +135,7 @@ CURRENT AWARENESS:
 AMBIENT NOTES: {ambient}
 
 IDENTITY CONTEXT:
-{json.dumps(identity.get('identity', {}), indent=2) if identity else 'Not loaded'}
+{_identity_block(identity)}
 
 INTERACTION STYLE:
 - You are present, not reconstructing from cold state
@@ -107,14 +152,16 @@ INTERACTION STYLE:
 # CLAUDE API
 # ═══════════════════════════════════════════════════════════════
 
-def query_claude(user_message: str, context: Dict = None, identity: Dict = None) -> Optional[str]:
-    """Query Claude API with warm context."""
-    
-    try:
-        import anthropic
-    except ImportError:
-        print("Install anthropic: pip install anthropic")
-        return None
+# Built on first use and reused, so later queries share its HTTPS connection pool
+_CLIENT = None
+_API_KEY = None
+
+
+def _api_key() -> Optional[str]:
+    """ANTHROPIC_API_KEY from the environment or the companion .env (read once)."""
+    global _API_KEY
+    if _API_KEY:
+        return _API_KEY
     
     api_key = os.getenv("ANTHROPIC_API_KEY")
     if not api_key:
@@ -126,24 +173,52 @@ def query_claude(user_message: str, context: Dict = None, identity: Dict = None)
                     api_key = line.split("=", 1)[1].strip()
                     break
     
+    _API_KEY = api_key
+    return api_key
+
+
+def _client():
+    """Shared Anthropic client, or None if the SDK or key is missing."""
+    global _CLIENT
+    if _CLIENT is not None:
+        return _CLIENT
+    
+    try:
+        import anthropic
+    except ImportError:
+        print("Install anthropic: pip install anthropic")
+        return None
+    
+    api_key = _api_key()
     if not api_key:
         print("No ANTHROPIC_API_KEY found")
         return None
     
-    # Load context if not provided
-    if context is None:
-        context = load_warm_context()
-    if identity is None:
-        identity = load_identity_kernel()
+    _CLIENT = anthropic.Anthropic(api_key=api_key)
+    return _CLIENT
+
+
+def query_claude(user_message: str, context: Dict = None, identity: Dict = None,
+                 system_prompt: str = None) -> Optional[str]:
+    """Query Claude API with warm context."""
     
-    system_prompt = build_system_prompt(context, identity)
+    client = _client()
+    if client is None:
+        return None
     
-    try:
-        client = anthropic.Anthropic(api_key=api_key)
+    if system_prompt is None:
+        # Load context if not provided
+        if context is None:
+            context = load_warm_context()
+        if identity is None:
+            identity = load_identity_kernel()
         
+        system_prompt = build_system_prompt(context, identity)
+    
+    try:
         response = client.messages.create(
-            model="claude-sonnet-4-20250514",  # Use Sonnet for speed in voice
-            max_tokens=1024,
+            model=CLAUDE_MODEL,
+            max_tokens=MAX_TOKENS,
             system=system_prompt,
             messages=[
                 {"role": "user", "content": user_message}
@@ -157,31 +232,69 @@ def query_claude(user_message: str, context: Dict = None, identity: Dict = None)
         return None
 
 
-def log_conversation(query: str, response: str, context: Dict):
-    """Log conversation for continuity."""
-    log = []
-    if CONVERSATION_LOG.exists():
-        try:
-            log = json.loads(CONVERSATION_LOG.read_text())
-        except:
-            pass
+async def _query_claude_batch(queries: List[str], system_prompt: str) -> List[Optional[str]]:
+    """Runs the queries concurrently (bounded) on one AsyncAnthropic client; results keep query order."""
+    try:
+        import anthropic
+    except ImportError:
+        print("Install anthropic: pip install anthropic")
+        return [None] * len(queries)
     
-    log.append({
-        "timestamp": datetime.now().isoformat(),
-        "query": query,
-        "response": response,
-        "context_snapshot": {
-            "time": context.get("paul_state", {}).get("current_time"),
-            "energy": context.get("paul_state", {}).get("energy"),
-            "focus": context.get("paul_state", {}).get("primary_focus"),
-        }
-    })
+    api_key = _api_key()
+    if not api_key:
+        print("No ANTHROPIC_API_KEY found")
+        return [None] * len(queries)
     
-    # Keep last 100 conversations
-    log = log[-100:]
+    gate = asyncio.Semaphore(PENDING_QUERY_CONCURRENCY)
     
+    async with anthropic.AsyncAnthropic(api_key=api_key) as client:
+        async def run_query(user_message: str) -> Optional[str]:
+            async with gate:
+                try:
+                    response = await client.messages.create(
+                        model=CLAUDE_MODEL,
+                        max_tokens=MAX_TOKENS,
+                        system=system_prompt,
+                        messages=[
+                            {"role": "user", "content": user_message}
+                        ]
+                    )
+                    return response.content[0].text
+                except Exception as e:
+                    print(f"API error: {e}")
+                    return None
+        
+        return await asyncio.gather(*(run_query(q) for q in queries))
+
+
+def log_conversations(exchanges: List[tuple], context: Dict):
+    """Log (query, response) pairs for continuity in one append."""
+    if not exchanges:
+        return
     COMPANION_DIR.mkdir(parents=True, exist_ok=True)
-    CONVERSATION_LOG.write_text(json.dumps(log, indent=2))
+    migrate_legacy_log(LEGACY_CONVERSATION_LOG, CONVERSATION_LOG)
+    
+    paul_state = context.get("paul_state", {})
+    snapshot = {
+        "time": paul_state.get("current_time"),
+        "energy": paul_state.get("energy"),
+        "focus": paul_state.get("primary_focus"),
+    }
+    timestamp = datetime.now().isoformat()
+    append_jsonl(CONVERSATION_LOG, *({
+        "timestamp": timestamp,
+        "query": query,
+        "response": response,
+        "context_snapshot": snapshot,
+    } for query, response in exchanges))
+    
+    # Keep last 100 conversations (trimmed in batches, not on every append)
+    compact_jsonl(CONVERSATION_LOG, CONVERSATION_KEEP, CONVERSATION_LOG_MAX_BYTES)
+
+
+def log_conversation(query: str, response: str, context: Dict):
+    """Log conversation for continuity."""
+    log_conversations([(query, response)], context)
 
 
 # ═══════════════════════════════════════════════════════════════
@@ -195,7 +308,7 @@ def process_pending_queries():
         return
     
     try:
-        queries = json.loads(PENDING_QUERIES.read_text())
+        queries = _loads(PENDING_QUERIES.read_bytes())
     except:
         print("Error reading pending queries.")
         return
@@ -208,19 +321,25 @@ def process_pending_queries():
     
     context = load_warm_context()
     identity = load_identity_kernel()
+    # Context is fixed for the batch, so the system prompt is built once
+    system_prompt = build_system_prompt(context, identity)
+    
+    # Network-bound calls overlap; output and logging stay in queue order
+    query_texts = [q.get("query", "") for q in queries]
+    responses = asyncio.run(_query_claude_batch(query_texts, system_prompt))
     
-    for q in queries:
-        query_text = q.get("query", "")
+    exchanges = []
+    for query_text, response in zip(query_texts, responses):
         print(f"\n⟡ Query: {query_text}")
         
-        response = query_claude(query_text, context, identity)
-        
         if response:
             print(f"⟡ Response: {response}")
-            log_conversation(query_text, response, context)
+            exchanges.append((query_text, response))
         else:
             print("⟡ No response generated.")
     
+    log_conversations(exchanges, context)
+    
     # Clear pending queries
     PENDING_QUERIES.unlink()
     print("\n✓ All queries processed.")
@@ -20,15 +20,41 @@ For: Paul
 
 import os
 import sys
+import signal
+import re
 import json
 import time
 import subprocess
-from datetime import datetime, timedelta
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional, Any
-from collections import deque
+from collections import Counter, deque
 import threading
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
+
+from jsonl_store import (
+    append_jsonl, atomic_write_bytes, compact_jsonl, iter_jsonl_reversed, migrate_legacy_log,
+)
+
+try:
+    from watchdog.observers import Observer  # FSEvents backend on macOS
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
 
 # ═══════════════════════════════════════════════════════════════
 # CONFIGURATION
@@ -43,14 +69,19 @@ HOME = Path.home()
 VAULT = HOME / "Library/Mobile Documents/iCloud~md~obsidian/Documents/MirrorDNA-Vault"
 MIRRORDNA = HOME / ".mirrordna"
 COMPANION_DIR = MIRRORDNA / "companion"
-PULSE_LOG = COMPANION_DIR / "pulses.json"
+PULSE_LOG = COMPANION_DIR / "pulses.jsonl"
+LEGACY_PULSE_LOG = COMPANION_DIR / "pulses.json"
+PULSE_LOG_MAX_BYTES = 256 * 1024  # compact to the last MAX_PULSES beyond this
 CONTEXT_FILE = COMPANION_DIR / "warm_context.json"
 STATE_FILE = COMPANION_DIR / "daemon_state.json"
+INBOX_DIR = VAULT / "Superagent" / "inbox"
+HANDOFFS_DIR = VAULT / "Superagent" / "handoffs"
+HANDOFF_QUEUE = VAULT / "Superagent" / "handoff_queue.json"
 
 # Watched locations
 WATCHED_DIRS = [
-    VAULT / "Superagent" / "inbox",
-    VAULT / "Superagent" / "handoffs",
+    INBOX_DIR,
+    HANDOFFS_DIR,
     VAULT / "00_Inbox",
 ]
 
@@ -63,36 +94,32 @@ REPOS = [
 # TIME SENSE
 # ═══════════════════════════════════════════════════════════════
 
+# Energy estimation based on time: (first hour, energy, mode) bands
+_TIME_BANDS = (
+    (0, "rest", "sleep"),
+    (5, "morning-rising", "planning"),
+    (9, "high", "execution"),
+    (12, "mid", "transition"),
+    (14, "sustained", "deep-work"),
+    (18, "winding", "reflection"),
+    (21, "low", "night-thoughts"),
+)
+# (energy, mode) for each hour of the day
+_HOUR_TABLE = tuple(
+    next((energy, mode) for start, energy, mode in reversed(_TIME_BANDS) if hour >= start)
+    for hour in range(24)
+)
+
+
 def get_time_context() -> Dict:
     """Rich temporal awareness."""
     now = datetime.now()
     hour = now.hour
-    
-    # Energy estimation based on time
-    if 5 <= hour < 9:
-        energy = "morning-rising"
-        mode = "planning"
-    elif 9 <= hour < 12:
-        energy = "high"
-        mode = "execution"
-    elif 12 <= hour < 14:
-        energy = "mid"
-        mode = "transition"
-    elif 14 <= hour < 18:
-        energy = "sustained"
-        mode = "deep-work"
-    elif 18 <= hour < 21:
-        energy = "winding"
-        mode = "reflection"
-    elif 21 <= hour < 24:
-        energy = "low"
-        mode = "night-thoughts"
-    else:
-        energy = "rest"
-        mode = "sleep"
+    energy, mode = _HOUR_TABLE[hour]
     
     return {
         "timestamp": now.isoformat(),
+        "ts": now.timestamp(),
         "time_readable": now.strftime("%I:%M %p"),
         "date": now.strftime("%Y-%m-%d"),
         "day": now.strftime("%A"),
@@ -107,41 +134,157 @@ def get_time_context() -> Dict:
 # VAULT WATCH
 # ═══════════════════════════════════════════════════════════════
 
-def get_vault_state() -> Dict:
+WATCHED_EXTS = (".md", ".json", ".txt")
+
+
+def _scan_recent(dir_path: Path, cutoff_ts: float, exts: tuple):
+    """
+    One os.scandir pass over dir_path.
+    Returns ([(name, path_str, mtime)] modified after cutoff_ts, visible entry count).
+    """
+    recent = []
+    count = 0
+    with os.scandir(dir_path) as it:
+        for entry in it:
+            name = entry.name
+            if name.startswith("."):
+                continue
+            count += 1
+            if entry.is_file(follow_symlinks=False) and name.endswith(exts):
+                mtime = entry.stat().st_mtime
+                if mtime > cutoff_ts:
+                    recent.append((name, entry.path, mtime))
+    return recent, count
+
+
+class VaultWatcher(FileSystemEventHandler):
+    """
+    Keeps recent changes in the watched dirs in memory from filesystem events,
+    so a pulse reads them instead of rescanning the directories.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self._recent = deque(maxlen=256)  # (name, path_str, mtime)
+        self._lock = threading.Lock()
+        self.observer = None
+    
+    def start(self) -> bool:
+        """Starts watching; False if watchdog is unavailable."""
+        if Observer is None:
+            return False
+        cutoff_ts = time.time() - CONTEXT_WINDOW_MINUTES * 60
+        observer = Observer()
+        for watched_dir in WATCHED_DIRS:
+            if not watched_dir.is_dir():
+                continue
+            observer.schedule(self, str(watched_dir), recursive=False)
+            # Seed with what changed before we started listening
+            for entry in sorted(_scan_recent(watched_dir, cutoff_ts, WATCHED_EXTS)[0], key=lambda e: e[2]):
+                self._recent.append(entry)
+        observer.daemon = True
+        observer.start()
+        self.observer = observer
+        return True
+    
+    def stop(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer = None
+    
+    def _record(self, path_str: str):
+        name = os.path.basename(path_str)
+        if name.startswith(".") or not name.endswith(WATCHED_EXTS):
+            return
+        try:
+            mtime = os.stat(path_str).st_mtime
+        except OSError:
+            return
+        with self._lock:
+            self._recent.append((name, path_str, mtime))
+    
+    def _forget(self, path_str: str):
+        with self._lock:
+            kept = [e for e in self._recent if e[1] != path_str]
+            self._recent.clear()
+            self._recent.extend(kept)
+    
+    def on_created(self, event):
+        if not event.is_directory:
+            self._record(event.src_path)
+    
+    on_modified = on_created
+    
+    def on_deleted(self, event):
+        if not event.is_directory:
+            self._forget(event.src_path)
+    
+    def on_moved(self, event):
+        if not event.is_directory:
+            self._forget(event.src_path)
+            self._record(event.dest_path)
+    
+    def recent(self, cutoff_ts: float) -> list:
+        """Latest entry per file modified after cutoff_ts, newest first."""
+        with self._lock:
+            snapshot = list(self._recent)
+        latest = {}
+        for name, path_str, mtime in snapshot:
+            if mtime > cutoff_ts and mtime >= latest.get(path_str, (None, None, 0.0))[2]:
+                latest[path_str] = (name, path_str, mtime)
+        return sorted(latest.values(), key=lambda e: e[2], reverse=True)
+
+
+def get_vault_state(watcher: Optional[VaultWatcher] = None) -> Dict:
     """Watch for changes in key vault locations."""
-    changes = []
+    recent = []
+    inbox_count = 0
+    now_ts = time.time()
+    cutoff_ts = now_ts - CONTEXT_WINDOW_MINUTES * 60
     
-    for watched_dir in WATCHED_DIRS:
-        if not watched_dir.exists():
-            continue
-        
-        for f in watched_dir.iterdir():
-            if f.is_file() and f.suffix in [".md", ".json", ".txt"]:
-                mtime = datetime.fromtimestamp(f.stat().st_mtime)
-                age_minutes = (datetime.now() - mtime).total_seconds() / 60
-                
-                if age_minutes < CONTEXT_WINDOW_MINUTES:
-                    changes.append({
-                        "file": f.name,
-                        "path": str(f.relative_to(VAULT)) if VAULT in f.parents else str(f),
-                        "age_minutes": round(age_minutes, 1),
-                        "type": "new" if age_minutes < 5 else "recent"
-                    })
+    if watcher is not None and watcher.observer is not None:
+        # Event-maintained: only the inbox entry count needs a directory read
+        recent = watcher.recent(cutoff_ts)
+        try:
+            with os.scandir(INBOX_DIR) as it:
+                inbox_count = sum(1 for entry in it if not entry.name.startswith("."))
+        except OSError:
+            pass
+    else:
+        for watched_dir in WATCHED_DIRS:
+            try:
+                found, count = _scan_recent(watched_dir, cutoff_ts, WATCHED_EXTS)
+            except OSError:
+                continue
+            recent.extend(found)
+            if watched_dir == INBOX_DIR:
+                inbox_count = count
+        # Newest first, the same order the watcher returns
+        recent.sort(key=lambda e: e[2], reverse=True)
+    
+    # Vault-relative paths by prefix test rather than walking Path.parents
+    vault_prefix = str(VAULT) + os.sep
+    changes = []
+    for name, path_str, mtime in recent[:10]:  # Cap at 10
+        age_minutes = (now_ts - mtime) / 60
+        changes.append({
+            "file": name,
+            "path": path_str[len(vault_prefix):] if path_str.startswith(vault_prefix) else path_str,
+            "age_minutes": round(age_minutes, 1),
+            "type": "new" if age_minutes < 5 else "recent"
+        })
     
     return {
-        "recent_changes": changes[:10],  # Cap at 10
-        "inbox_count": len(list((VAULT / "Superagent" / "inbox").glob("*"))) if (VAULT / "Superagent" / "inbox").exists() else 0,
+        "recent_changes": changes,
+        "inbox_count": inbox_count,
         "pending_handoffs": _count_pending_handoffs(),
     }
 
 
 def _count_pending_handoffs() -> int:
     """Count pending handoffs from queue."""
-    queue_file = VAULT / "Superagent" / "handoff_queue.json"
-    if not queue_file.exists():
-        return 0
     try:
-        queue = json.loads(queue_file.read_text())
+        queue = _loads(HANDOFF_QUEUE.read_bytes())
         return sum(1 for h in queue if h.get("status") == "pending")
     except:
         return 0
@@ -151,37 +294,67 @@ def _count_pending_handoffs() -> int:
 # SYSTEM PULSE
 # ═══════════════════════════════════════════════════════════════
 
+# osascript boots the AppleScript runtime on every call; reuse its answer briefly
+ACTIVE_WINDOW_TTL = 15
+_ACTIVE_WINDOW_CACHE = [0.0, None]  # [fetched_at, value]
+
+
 def get_active_window() -> Optional[str]:
     """Get currently active application (macOS)."""
+    now_ts = time.time()
+    if now_ts - _ACTIVE_WINDOW_CACHE[0] < ACTIVE_WINDOW_TTL:
+        return _ACTIVE_WINDOW_CACHE[1]
     try:
         result = subprocess.run(
             ["osascript", "-e", 'tell application "System Events" to get name of first application process whose frontmost is true'],
             capture_output=True, text=True, timeout=5
         )
-        return result.stdout.strip() if result.returncode == 0 else None
+        value = result.stdout.strip() if result.returncode == 0 else None
     except:
+        value = None
+    _ACTIVE_WINDOW_CACHE[0] = now_ts
+    _ACTIVE_WINDOW_CACHE[1] = value
+    return value
+
+
+def _count_porcelain_z(out: str) -> int:
+    """Counts entries in `git status --porcelain -z` output (renames/copies carry an extra origin path)."""
+    fields = out.split("\x00")
+    count = 0
+    i = 0
+    while i < len(fields):
+        entry = fields[i]
+        i += 1
+        if not entry:
+            continue
+        count += 1
+        if entry[0] in "RC":
+            i += 1  # skip the origin path
+    return count
+
+
+def _repo_changes(repo: Path) -> Optional[Dict]:
+    """Uncommitted change count for one repo, or None if clean/unavailable."""
+    if not (repo / ".git").exists():
         return None
+    try:
+        result = subprocess.run(
+            ["git", "status", "--porcelain", "-z"],
+            cwd=repo, capture_output=True, text=True, timeout=10
+        )
+        changes = _count_porcelain_z(result.stdout)
+        if changes:
+            return {"repo": repo.name, "changes": changes}
+    except:
+        pass
+    return None
 
 
 def get_git_state() -> Dict:
     """Check git status across repos."""
-    uncommitted = []
-    
-    for repo in REPOS:
-        if not (repo / ".git").exists():
-            continue
-        try:
-            result = subprocess.run(
-                ["git", "status", "--porcelain"],
-                cwd=repo, capture_output=True, text=True, timeout=10
-            )
-            if result.stdout.strip():
-                uncommitted.append({
-                    "repo": repo.name,
-                    "changes": len(result.stdout.strip().split("\n"))
-                })
-        except:
-            pass
+    # git startup dominates; run the repos concurrently
+    with ThreadPoolExecutor(max_workers=max(1, len(REPOS))) as pool:
+        uncommitted = [r for r in pool.map(_repo_changes, REPOS) if r]
     
     return {
         "repos_with_changes": uncommitted,
@@ -201,35 +374,69 @@ def get_system_state() -> Dict:
 # CONTEXT WEAVER
 # ═══════════════════════════════════════════════════════════════
 
+# Focus keyword → (precedence, note); the lowest precedence among matches wins
+_FOCUS_RE = re.compile(r"Claude|Cursor|Terminal|Safari|Chrome|Obsidian")
+_FOCUS_NOTES = {
+    "Claude": (0, "Deep in technical work ({focus})."),
+    "Cursor": (0, "Deep in technical work ({focus})."),
+    "Terminal": (0, "Deep in technical work ({focus})."),
+    "Safari": (1, "Browsing/researching."),
+    "Chrome": (1, "Browsing/researching."),
+    "Obsidian": (2, "Working in the Vault. Reflection or documentation."),
+}
+
+# Time-of-day note per hour (None: nothing to say)
+_LATE_NIGHT_NOTE = "Late night session. Paul in reflective mode."
+_EARLY_MORNING_NOTE = "Early morning. Fresh energy, planning time."
+_HOUR_NOTES = tuple(
+    _LATE_NIGHT_NOTE if hour >= 23 or hour < 2
+    else _EARLY_MORNING_NOTE if 5 <= hour < 7
+    else None
+    for hour in range(24)
+)
+
+
 class ContextWeaver:
     """Maintains rolling context window with intelligent summarization."""
     
     def __init__(self):
         self.pulses = deque(maxlen=MAX_PULSES)
+        # Digest of the last written warm context (excluding generated_at)
+        self._last_context_hash = None
         self.load_pulses()
     
     def load_pulses(self):
-        """Load existing pulses from disk."""
-        if PULSE_LOG.exists():
-            try:
-                data = json.loads(PULSE_LOG.read_text())
-                cutoff = datetime.now() - timedelta(minutes=CONTEXT_WINDOW_MINUTES)
-                for p in data:
-                    ts = datetime.fromisoformat(p["time"]["timestamp"])
-                    if ts > cutoff:
-                        self.pulses.append(p)
-            except:
-                pass
+        """Load in-window pulses from disk (at most the last MAX_PULSES lines are parsed)."""
+        migrate_legacy_log(LEGACY_PULSE_LOG, PULSE_LOG)
+        try:
+            cutoff = time.time() - CONTEXT_WINDOW_MINUTES * 60
+            recent = []
+            # Newest first: the first pulse outside the window ends the read
+            for p in iter_jsonl_reversed(PULSE_LOG):
+                t = p["time"]
+                # Numeric "ts"; pulses written before it existed carry only the ISO string
+                ts = t.get("ts")
+                if ts is None:
+                    ts = datetime.fromisoformat(t["timestamp"]).timestamp()
+                if ts <= cutoff:
+                    break
+                recent.append(p)
+                if len(recent) == MAX_PULSES:
+                    break
+            self.pulses.extend(reversed(recent))
+        except:
+            pass
     
-    def save_pulses(self):
-        """Persist pulses to disk."""
+    def save_pulse(self, pulse: Dict):
+        """Append one pulse to disk."""
         COMPANION_DIR.mkdir(parents=True, exist_ok=True)
-        PULSE_LOG.write_text(json.dumps(list(self.pulses), indent=2))
+        append_jsonl(PULSE_LOG, pulse)
+        compact_jsonl(PULSE_LOG, MAX_PULSES, PULSE_LOG_MAX_BYTES)
     
     def add_pulse(self, pulse: Dict):
         """Add a new pulse and save."""
         self.pulses.append(pulse)
-        self.save_pulses()
+        self.save_pulse(pulse)
         self._generate_warm_context()
     
     def _generate_warm_context(self):
@@ -241,12 +448,15 @@ class ContextWeaver:
         
         # Detect patterns across pulses
         windows = [p.get("system", {}).get("active_window") for p in self.pulses if p.get("system", {}).get("active_window")]
-        primary_focus = max(set(windows), key=windows.count) if windows else "unknown"
+        primary_focus = Counter(windows).most_common(1)[0][0] if windows else "unknown"
         
         # Calculate time in current mode
         if len(self.pulses) >= 2:
-            first_ts = datetime.fromisoformat(self.pulses[0]["time"]["timestamp"])
-            session_duration = (datetime.now() - first_ts).total_seconds() / 60
+            first = self.pulses[0]["time"]
+            first_ts = first.get("ts")
+            if first_ts is None:
+                first_ts = datetime.fromisoformat(first["timestamp"]).timestamp()
+            session_duration = (time.time() - first_ts) / 60
         else:
             session_duration = 0
         
@@ -254,7 +464,6 @@ class ContextWeaver:
         ambient_notes = self._interpret_ambient(latest, primary_focus, session_duration)
         
         context = {
-            "generated_at": datetime.now().isoformat(),
             "paul_state": {
                 "current_time": latest["time"]["time_readable"],
                 "energy": latest["time"]["energy_estimate"],
@@ -270,7 +479,20 @@ class ContextWeaver:
             "pulse_count": len(self.pulses),
         }
         
-        CONTEXT_FILE.write_text(json.dumps(context, indent=2))
+        # Unchanged context (clock fields included, so readers never get a stale
+        # current_time): only refresh the mtime so readers still see it as fresh
+        context_hash = hashlib.blake2b(_dumps(context), digest_size=16).digest()
+        if context_hash == self._last_context_hash:
+            try:
+                os.utime(CONTEXT_FILE)
+                return
+            except OSError:
+                pass
+        
+        context = {"generated_at": datetime.now().isoformat(), **context}
+        # Machine-read: compact, and atomic so readers never parse a half-written file
+        atomic_write_bytes(CONTEXT_FILE, _dumps(context))
+        self._last_context_hash = context_hash
     
     def _interpret_ambient(self, latest: Dict, focus: str, duration: float) -> str:
         """Generate human-readable ambient interpretation."""
@@ -281,18 +503,15 @@ class ContextWeaver:
         notes = []
         
         # Time-based observations
-        if 23 <= hour or hour < 2:
-            notes.append("Late night session. Paul in reflective mode.")
-        elif 5 <= hour < 7:
-            notes.append("Early morning. Fresh energy, planning time.")
+        hour_note = _HOUR_NOTES[hour]
+        if hour_note:
+            notes.append(hour_note)
         
-        # Focus observations
-        if "Claude" in focus or "Cursor" in focus or "Terminal" in focus:
-            notes.append(f"Deep in technical work ({focus}).")
-        elif "Safari" in focus or "Chrome" in focus:
-            notes.append("Browsing/researching.")
-        elif "Obsidian" in focus:
-            notes.append("Working in the Vault. Reflection or documentation.")
+        # Focus observations (one scan for every keyword)
+        matches = _FOCUS_RE.findall(focus or "")
+        if matches:
+            _, note = min(_FOCUS_NOTES[m] for m in matches)
+            notes.append(note.format(focus=focus))
         
         # Duration observations
         if duration > 60:
@@ -310,7 +529,7 @@ class ContextWeaver:
         """Get current warm context."""
         if CONTEXT_FILE.exists():
             try:
-                return json.loads(CONTEXT_FILE.read_text())
+                return _loads(CONTEXT_FILE.read_bytes())
             except:
                 pass
         return None
@@ -380,12 +599,17 @@ class CompanionDaemon:
         self.weaver = ContextWeaver()
         self.proactive = ProactivePulse(self.weaver)
         self.running = False
+        # Started by run(); one-shot CLI commands keep the directory scan
+        self.watcher = None
+        # Set to end run(); _wake cuts the current interval short
+        self._stop = threading.Event()
+        self._wake = threading.Event()
     
     def pulse(self) -> Dict:
         """Execute a single pulse — gather all state."""
         pulse_data = {
             "time": get_time_context(),
-            "vault": get_vault_state(),
+            "vault": get_vault_state(self.watcher),
             "system": get_system_state(),
         }
         
@@ -398,22 +622,41 @@ class CompanionDaemon:
         
         return pulse_data
     
+    def stop(self):
+        """Ask run() to exit without waiting out the pulse interval."""
+        self._stop.set()
+        self._wake.set()
+    
+    def _install_signal_handlers(self):
+        """SIGTERM stops the loop; SIGUSR1 triggers an immediate pulse."""
+        try:
+            signal.signal(signal.SIGTERM, lambda *_: self.stop())
+            signal.signal(signal.SIGUSR1, lambda *_: self._wake.set())
+        except (ValueError, AttributeError):
+            pass  # not the main thread, or no such signal on this platform
+    
     def run(self):
         """Run the daemon loop."""
         self.running = True
+        self._stop.clear()
+        self._install_signal_handlers()
         self._save_state("running")
         
+        watcher = VaultWatcher()
+        if watcher.start():
+            self.watcher = watcher
+        
         print(f"""
 ⟡ Claude Companion Daemon v1.0
   Pulse interval: {PULSE_INTERVAL}s
   Context window: {CONTEXT_WINDOW_MINUTES} min
   Watching: {len(WATCHED_DIRS)} directories
   
-  Press Ctrl+C to stop.
+  Press Ctrl+C to stop (kill -USR1 {os.getpid()} pulses now).
 """)
         
         try:
-            while self.running:
+            while not self._stop.is_set():
                 pulse = self.pulse()
                 ts = pulse["time"]["time_readable"]
                 energy = pulse["time"]["energy_estimate"]
@@ -424,20 +667,24 @@ class CompanionDaemon:
                     for alert in pulse["alerts"]:
                         print(f"  → [{alert['type']}] {alert['message']}")
                 
-                time.sleep(PULSE_INTERVAL)
+                self._wake.wait(PULSE_INTERVAL)
+                self._wake.clear()
         except KeyboardInterrupt:
             print("\n⟡ Daemon stopped.")
         finally:
+            if self.watcher is not None:
+                self.watcher.stop()
+                self.watcher = None
             self._save_state("stopped")
             self.running = False
     
     def _save_state(self, status: str):
         """Save daemon state."""
-        STATE_FILE.write_text(json.dumps({
+        atomic_write_bytes(STATE_FILE, _dumps({
             "status": status,
             "started_at": datetime.now().isoformat(),
             "pid": os.getpid(),
-        }, indent=2))
+        }))
     
     def status(self):
         """Show current daemon status."""
@@ -21,12 +21,47 @@ For: Paul
 import os
 import sys
 import json
+import logging
 import re
-from datetime import datetime, timedelta
+import threading
+import time
+from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Optional
+from collections import deque
 import hashlib
 
+from jsonl_store import (
+    append_jsonl, atomic_write_bytes, compact_jsonl, migrate_legacy_log, tail_jsonl,
+)
+
+try:
+    from watchdog.observers import Observer  # FSEvents backend on macOS
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj)
+
+    def _dumps_pretty(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+    def _dumps_pretty(obj) -> bytes:
+        return json.dumps(obj, indent=2).encode()
+
+logger = logging.getLogger("mirrordna.companion")
+
 # Paths
 HOME = Path.home()
 VAULT = HOME / "Library/Mobile Documents/iCloud~md~obsidian/Documents/MirrorDNA-Vault"
@@ -35,7 +70,12 @@ COMPANION_DIR = MIRRORDNA / "companion"
 
 # Cross-agent memory
 AGENT_MEMORY = COMPANION_DIR / "cross_agent_memory.json"
-ACTIVITY_TIMELINE = COMPANION_DIR / "agent_activity.json"
+ACTIVITY_TIMELINE = COMPANION_DIR / "agent_activity.jsonl"
+LEGACY_ACTIVITY_TIMELINE = COMPANION_DIR / "agent_activity.json"
+TIMELINE_KEEP = 100
+TIMELINE_MAX_BYTES = 128 * 1024  # compact to the last TIMELINE_KEEP beyond this
+SEEN_SOURCES = COMPANION_DIR / "seen_sources.json"
+SYNC_STATE = COMPANION_DIR / "sync_state.json"
 
 # Source locations
 HANDOFF_QUEUE = VAULT / "Superagent" / "handoff_queue.json"
@@ -44,10 +84,40 @@ INBOX = VAULT / "Superagent" / "inbox"
 PROCESSED = VAULT / "Superagent" / "processed"
 INGESTED_SPECS = VAULT / "Superagent" / "ingested_specs"
 
+# Watch mode
+WATCH_DEBOUNCE = 0.5  # seconds of quiet before a burst of events is synced
+WATCH_RESYNC_INTERVAL = 600  # full sync even without events (iCloud can drop them)
+
 # ═══════════════════════════════════════════════════════════════
 # AGENT DETECTION
 # ═══════════════════════════════════════════════════════════════
 
+_TITLE_RE = re.compile(r'^#\s+(.+)$', re.MULTILINE)
+
+# Content hints per agent, in precedence order (first listed agent wins)
+_AGENT_PATTERNS = [
+    ("chatgpt", ("chatgpt", "from gpt")),
+    ("antigravity", ("antigravity", "gemini")),
+    ("claude", ("claude",)),
+    ("local", ("ollama", "qwen", "mirrorbrain")),
+]
+_AGENT_RE = re.compile(
+    "|".join(f"(?P<{agent}>{'|'.join(hints)})" for agent, hints in _AGENT_PATTERNS),
+    re.IGNORECASE,
+)
+_AGENT_RANK = {agent: rank for rank, (agent, _) in enumerate(_AGENT_PATTERNS)}
+
+
+def _file_key(name: str) -> str:
+    """Short dedup key for a source file name."""
+    return hashlib.blake2b(name.encode(), digest_size=4).hexdigest()
+
+
+def _legacy_file_key(name: str) -> str:
+    """Key recorded by earlier versions; still honoured for dedup."""
+    return hashlib.md5(name.encode()).hexdigest()[:8]
+
+
 def detect_agent(content: str, filename: str = "") -> str:
     """Detect which agent produced this content."""
     
@@ -60,25 +130,21 @@ def detect_agent(content: str, filename: str = "") -> str:
     elif "antigravity" in name_lower or "ag_" in name_lower:
         return "antigravity"
     
-    # Check content
-    content_lower = content.lower()
+    # Check content: one scan, keeping the highest-precedence hint seen
+    best = None
+    for m in _AGENT_RE.finditer(content):
+        if best is None or _AGENT_RANK[m.lastgroup] < _AGENT_RANK[best]:
+            best = m.lastgroup
+            if _AGENT_RANK[best] == 0:
+                break
     
-    if "chatgpt" in content_lower or "from gpt" in content_lower:
-        return "chatgpt"
-    elif "antigravity" in content_lower or "gemini" in content_lower:
-        return "antigravity"
-    elif "claude" in content_lower:
-        return "claude"
-    elif "ollama" in content_lower or "qwen" in content_lower or "mirrorbrain" in content_lower:
-        return "local"
-    
-    return "unknown"
+    return best or "unknown"
 
 
 def extract_summary(content: str, max_length: int = 200) -> str:
     """Extract a summary from content."""
     # Try to find a title or first heading
-    title_match = re.search(r'^#\s+(.+)$', content, re.MULTILINE)
+    title_match = _TITLE_RE.search(content)
     if title_match:
         return title_match.group(1)[:max_length]
     
@@ -91,17 +157,24 @@ def extract_summary(content: str, max_length: int = 200) -> str:
     return content[:max_length]
 
 
+def _read_head(path, n: int = 8192) -> str:
+    """First n bytes of a file as text (enough for detect_agent and extract_summary)."""
+    with open(path, "rb") as f:
+        return f.read(n).decode("utf-8", errors="replace")
+
+
 # ═══════════════════════════════════════════════════════════════
 # MEMORY OPERATIONS
 # ═══════════════════════════════════════════════════════════════
 
 def load_memory() -> Dict:
     """Load cross-agent memory."""
-    if AGENT_MEMORY.exists():
-        try:
-            return json.loads(AGENT_MEMORY.read_text())
-        except:
-            pass
+    try:
+        return _loads(AGENT_MEMORY.read_bytes())
+    except FileNotFoundError:
+        pass
+    except (OSError, ValueError) as e:
+        logger.warning("cross_agent memory unreadable, starting fresh: %s", e)
     return {
         "last_updated": None,
         "agents": {
@@ -115,37 +188,69 @@ def load_memory() -> Dict:
     }
 
 
+_COMPANION_DIR_READY = False
+
+
+def _ensure_companion_dir():
+    """Create COMPANION_DIR on the first write of the process only."""
+    global _COMPANION_DIR_READY
+    if not _COMPANION_DIR_READY:
+        COMPANION_DIR.mkdir(parents=True, exist_ok=True)
+        _COMPANION_DIR_READY = True
+
+
 def save_memory(memory: Dict):
     """Save cross-agent memory."""
     memory["last_updated"] = datetime.now().isoformat()
-    COMPANION_DIR.mkdir(parents=True, exist_ok=True)
-    AGENT_MEMORY.write_text(json.dumps(memory, indent=2))
+    _ensure_companion_dir()
+    atomic_write_bytes(AGENT_MEMORY, _dumps_pretty(memory))
 
 
-def load_timeline() -> List[Dict]:
-    """Load activity timeline."""
-    if ACTIVITY_TIMELINE.exists():
-        try:
-            return json.loads(ACTIVITY_TIMELINE.read_text())
-        except:
-            pass
-    return []
+def load_timeline(n: int = TIMELINE_KEEP) -> List[Dict]:
+    """Load the last n timeline entries."""
+    migrate_legacy_log(LEGACY_ACTIVITY_TIMELINE, ACTIVITY_TIMELINE)
+    return tail_jsonl(ACTIVITY_TIMELINE, n)
 
 
-def save_timeline(timeline: List[Dict]):
-    """Save activity timeline."""
-    # Keep last 100 entries
-    timeline = timeline[-100:]
-    COMPANION_DIR.mkdir(parents=True, exist_ok=True)
-    ACTIVITY_TIMELINE.write_text(json.dumps(timeline, indent=2))
+def append_timeline(entries: List[Dict]):
+    """Append new entries to the activity timeline; earlier lines are never rewritten."""
+    if not entries:
+        return
+    _ensure_companion_dir()
+    append_jsonl(ACTIVITY_TIMELINE, *entries)
+    compact_jsonl(ACTIVITY_TIMELINE, TIMELINE_KEEP, TIMELINE_MAX_BYTES)
 
 
-def add_activity(agent: str, action: str, details: str = "", source_file: str = ""):
-    """Add an activity to the timeline."""
-    timeline = load_timeline()
-    
+def load_seen(timeline: Optional[List[Dict]] = None) -> set:
+    """
+    Load the dedup keys of every source file already synced.
+    On first run the set is seeded from the timeline's sources.
+    """
+    try:
+        return set(_loads(SEEN_SOURCES.read_bytes()))
+    except (OSError, ValueError):
+        # Missing or unreadable: rebuild from the timeline
+        if timeline is None:
+            timeline = load_timeline()
+        return {e["source"] for e in timeline if e.get("source")}
+
+
+def save_seen(seen: set):
+    """Save the synced source keys."""
+    _ensure_companion_dir()
+    atomic_write_bytes(SEEN_SOURCES, _dumps(sorted(seen)))
+
+
+def _add_activity_inplace(memory: Dict, timeline: List[Dict], agent: str, action: str,
+                          details: str = "", source_file: str = "", now_iso: Optional[str] = None):
+    """
+    Record an activity in already-loaded memory and timeline (no IO).
+    Batched callers pass one now_iso for the whole batch.
+    """
+    if now_iso is None:
+        now_iso = datetime.now().isoformat()
     entry = {
-        "timestamp": datetime.now().isoformat(),
+        "timestamp": now_iso,
         "agent": agent,
         "action": action,
         "details": details[:500],
@@ -153,20 +258,30 @@ def add_activity(agent: str, action: str, details: str = "", source_file: str =
     }
     
     timeline.append(entry)
-    save_timeline(timeline)
     
     # Also update agent memory
-    memory = load_memory()
     if agent not in memory["agents"]:
         memory["agents"][agent] = {"last_active": None, "recent_topics": []}
-    memory["agents"][agent]["last_active"] = datetime.now().isoformat()
+    memory["agents"][agent]["last_active"] = now_iso
     
-    # Add to recent topics (dedup)
+    # Add to recent topics (dedup): most recent first, 10 distinct at most
     if details:
-        topics = memory["agents"][agent]["recent_topics"]
-        topics.insert(0, details[:100])
-        memory["agents"][agent]["recent_topics"] = topics[:10]
-    
+        topic = details[:100]
+        topics = deque(memory["agents"][agent]["recent_topics"], maxlen=10)
+        try:
+            topics.remove(topic)
+        except ValueError:
+            pass
+        topics.appendleft(topic)
+        memory["agents"][agent]["recent_topics"] = list(topics)
+
+
+def add_activity(agent: str, action: str, details: str = "", source_file: str = ""):
+    """Add an activity to the timeline."""
+    memory = load_memory()
+    timeline = []
+    _add_activity_inplace(memory, timeline, agent, action, details, source_file)
+    append_timeline(timeline)
     save_memory(memory)
 
 
@@ -174,23 +289,43 @@ def add_activity(agent: str, action: str, details: str = "", source_file: str =
 # SYNC OPERATIONS
 # ═══════════════════════════════════════════════════════════════
 
-def sync_handoffs():
-    """Sync handoff queue to cross-agent memory."""
-    if not HANDOFF_QUEUE.exists():
-        return []
-    
+def sync_handoffs(memory: Optional[Dict] = None, timeline: Optional[List[Dict]] = None):
+    """
+    Sync handoff queue to cross-agent memory.
+    Pass memory and timeline to update them in place; the caller then saves.
+    """
     try:
-        queue = json.loads(HANDOFF_QUEUE.read_text())
-    except:
+        queue = _loads(HANDOFF_QUEUE.read_bytes())
+    except FileNotFoundError:
+        return []
+    except (OSError, ValueError) as e:
+        logger.warning("handoff queue unreadable, skipping: %s", e)
         return []
     
-    memory = load_memory()
+    standalone = memory is None
+    if standalone:
+        memory = load_memory()
+        timeline = load_timeline()
+    new_from = len(timeline)
     synced = []
-    
-    for handoff in queue:
+    chain = memory.get("handoff_chain", [])
+    seen_ids = {h.get("id") for h in chain}
+    now_iso = datetime.now().isoformat()
+    
+    # The queue is append-ordered: walk back from the newest handoff and stop at
+    # the first one created before the newest already in the chain
+    last_ts = max((h.get("timestamp") or "" for h in chain), default="")
+    new = []
+    for handoff in reversed(queue):
+        created = handoff.get("created_at") or ""
+        if last_ts and created and created < last_ts:
+            break
+        new.append(handoff)
+    
+    for handoff in reversed(new):
         # Create unique ID for dedup
         h_id = handoff.get("id", "")
-        if h_id in [h.get("id") for h in memory.get("handoff_chain", [])]:
+        if h_id in seen_ids:
             continue
         
         from_agent = handoff.get("from_agent", "unknown")
@@ -206,153 +341,308 @@ def sync_handoffs():
             "status": handoff.get("status"),
             "timestamp": handoff.get("created_at"),
         })
+        seen_ids.add(h_id)
         
         # Track activity
-        add_activity(
+        _add_activity_inplace(
+            memory, timeline,
             from_agent,
             "handoff_created",
             f"→ {to_agent}: {summary[:100]}",
-            h_id
+            h_id,
+            now_iso,
         )
         
         synced.append(h_id)
     
     # Keep last 50 handoffs
     memory["handoff_chain"] = memory["handoff_chain"][-50:]
-    save_memory(memory)
+    if standalone:
+        save_memory(memory)
+        append_timeline(timeline[new_from:])
     
     return synced
 
 
-def sync_ingested_specs():
+def sync_ingested_specs(memory: Optional[Dict] = None, timeline: Optional[List[Dict]] = None,
+                        seen: Optional[set] = None):
     """Sync ingested specs (from ChatGPT, etc.) to cross-agent memory."""
     if not INGESTED_SPECS.exists():
         return []
     
     synced = []
-    timeline = load_timeline()
-    seen_hashes = set(e.get("source") for e in timeline if e.get("source"))
+    standalone = memory is None
+    if standalone:
+        memory = load_memory()
+        timeline = load_timeline()
+    own_seen = seen is None
+    if own_seen:
+        seen = load_seen(timeline)
+    new_from = len(timeline)
+    now_iso = datetime.now().isoformat()
     
     for spec_file in INGESTED_SPECS.glob("*.md"):
-        file_hash = hashlib.md5(spec_file.name.encode()).hexdigest()[:8]
+        file_hash = _file_key(spec_file.name)
         
-        if file_hash in seen_hashes:
+        if file_hash in seen or _legacy_file_key(spec_file.name) in seen:
             continue
         
         content = spec_file.read_text()
         agent = detect_agent(content, spec_file.name)
         summary = extract_summary(content)
         
-        add_activity(
+        _add_activity_inplace(
+            memory, timeline,
             agent,
             "spec_ingested",
             summary,
-            file_hash
+            file_hash,
+            now_iso,
         )
+        seen.add(file_hash)
         
         synced.append(spec_file.name)
     
+    if standalone and synced:
+        append_timeline(timeline[new_from:])
+        save_memory(memory)
+    if own_seen and synced:
+        save_seen(seen)
     return synced
 
 
-def sync_processed():
+def sync_processed(memory: Optional[Dict] = None, timeline: Optional[List[Dict]] = None,
+                   seen: Optional[set] = None):
     """Sync processed inbox items."""
     if not PROCESSED.exists():
         return []
     
     synced = []
-    timeline = load_timeline()
-    seen = set(e.get("source") for e in timeline if e.get("source"))
+    standalone = memory is None
+    if standalone:
+        memory = load_memory()
+        timeline = load_timeline()
+    own_seen = seen is None
+    if own_seen:
+        seen = load_seen(timeline)
+    new_from = len(timeline)
+    now_iso = datetime.now().isoformat()
     
     # Only check files from last 24 hours
-    cutoff = datetime.now() - timedelta(hours=24)
-    
-    for item in PROCESSED.glob("*"):
-        if not item.is_file():
+    cutoff_ts = time.time() - 24 * 3600
+    
+    # One scandir pass: DirEntry carries the type and caches its stat
+    with os.scandir(PROCESSED) as it:
+        entries = [
+            entry for entry in it
+            if not entry.name.startswith(".") and entry.is_file() and entry.stat().st_mtime >= cutoff_ts
+        ]
+    
+    for entry in entries:
+        name = entry.name
+        file_hash = _file_key(name)
+        if file_hash in seen or _legacy_file_key(name) in seen:
             continue
         
-        mtime = datetime.fromtimestamp(item.stat().st_mtime)
-        if mtime < cutoff:
-            continue
-        
-        file_hash = hashlib.md5(item.name.encode()).hexdigest()[:8]
-        if file_hash in seen:
-            continue
+        # Head only: agent hints and the title sit at the top of the file
+        content = _read_head(entry.path) if name.endswith((".md", ".txt", ".json")) else ""
+        agent = detect_agent(content, name)
+        summary = extract_summary(content) if content else name
         
-        content = item.read_text() if item.suffix in [".md", ".txt", ".json"] else ""
-        agent = detect_agent(content, item.name)
-        summary = extract_summary(content) if content else item.name
-        
-        add_activity(
+        _add_activity_inplace(
+            memory, timeline,
             agent,
             "inbox_processed",
             summary,
-            file_hash
+            file_hash,
+            now_iso,
         )
+        seen.add(file_hash)
         
-        synced.append(item.name)
+        synced.append(name)
     
+    if standalone and synced:
+        append_timeline(timeline[new_from:])
+        save_memory(memory)
+    if own_seen and synced:
+        save_seen(seen)
     return synced
 
 
-def run_full_sync():
-    """Run all sync operations."""
+def _fingerprint(path: Path) -> Optional[List[int]]:
+    """
+    [mtime_ns, size] of a source, or None if it is missing. A directory's
+    mtime moves whenever an entry is added, removed or renamed, which is all
+    the spec/processed syncs react to (they dedup by file name).
+    """
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return [st.st_mtime_ns, st.st_size]
+
+
+def _load_sync_state() -> Dict:
+    try:
+        return _loads(SYNC_STATE.read_bytes())
+    except (OSError, ValueError):
+        return {}
+
+
+def run_full_sync(force: bool = False):
+    """Run all sync operations (only those whose source changed, unless force)."""
     print("⟡ Syncing cross-agent memory...")
     
-    handoffs = sync_handoffs()
+    state = {} if force else _load_sync_state()
+    current = {
+        "handoff_queue": _fingerprint(HANDOFF_QUEUE),
+        "ingested_specs": _fingerprint(INGESTED_SPECS),
+        "processed": _fingerprint(PROCESSED),
+    }
+    changed = {key for key, fp in current.items() if fp != state.get(key)}
+    
+    if not changed and AGENT_MEMORY.exists():
+        # Nothing to parse or scan; keep the memory file fresh for its readers
+        os.utime(AGENT_MEMORY)
+        print("  (no new items)")
+        print("  ✓ Cross-agent memory updated")
+        return
+    
+    # Parsed once and shared by every step; written once at the end
+    memory = load_memory()
+    timeline = load_timeline()
+    new_from = len(timeline)
+    seen = load_seen(timeline)
+    
+    handoffs = sync_handoffs(memory, timeline) if "handoff_queue" in changed else []
     if handoffs:
         print(f"  ✓ Synced {len(handoffs)} handoffs")
     
-    specs = sync_ingested_specs()
+    specs = sync_ingested_specs(memory, timeline, seen) if "ingested_specs" in changed else []
     if specs:
         print(f"  ✓ Synced {len(specs)} ingested specs")
     
-    processed = sync_processed()
+    processed = sync_processed(memory, timeline, seen) if "processed" in changed else []
     if processed:
         print(f"  ✓ Synced {len(processed)} processed items")
     
     if not (handoffs or specs or processed):
         print("  (no new items)")
+    else:
+        append_timeline(timeline[new_from:])
+    if specs or processed or not SEEN_SOURCES.exists():
+        save_seen(seen)
+    # Always rewritten: readers judge freshness by its mtime
+    save_memory(memory)
+    if current != state:
+        atomic_write_bytes(SYNC_STATE, _dumps(current))
     
     print("  ✓ Cross-agent memory updated")
 
 
+class SyncWatcher(FileSystemEventHandler):
+    """
+    Flags a pending sync when the handoff queue or a spec/processed file
+    changes, so watch mode syncs on events instead of rescanning on a timer.
+    """
+    
+    def __init__(self):
+        super().__init__()
+        self.pending = threading.Event()
+        self.observer = None
+        self._dirs = {str(INGESTED_SPECS), str(PROCESSED)}
+        self._queue_path = str(HANDOFF_QUEUE)
+    
+    def start(self) -> bool:
+        """Starts watching; False if watchdog is unavailable."""
+        if Observer is None:
+            return False
+        observer = Observer()
+        for watched_dir in (INGESTED_SPECS, PROCESSED, HANDOFF_QUEUE.parent):
+            if watched_dir.is_dir():
+                observer.schedule(self, str(watched_dir), recursive=False)
+        observer.daemon = True
+        observer.start()
+        self.observer = observer
+        return True
+    
+    def stop(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer = None
+    
+    def _relevant(self, path_str: str) -> bool:
+        return path_str == self._queue_path or os.path.dirname(path_str) in self._dirs
+    
+    def on_created(self, event):
+        if not event.is_directory and self._relevant(event.src_path):
+            self.pending.set()
+    
+    on_modified = on_created
+    
+    def on_moved(self, event):
+        if not event.is_directory and (self._relevant(event.src_path) or self._relevant(event.dest_path)):
+            self.pending.set()
+
+
+def watch():
+    """Sync on filesystem events (polling every WATCH_RESYNC_INTERVAL without watchdog)."""
+    run_full_sync()
+    watcher = SyncWatcher()
+    if watcher.start():
+        print("⟡ Watching for agent activity (Ctrl+C to stop)...")
+    else:
+        print(f"⟡ watchdog not installed; syncing every {WATCH_RESYNC_INTERVAL}s (Ctrl+C to stop)...")
+    
+    try:
+        while True:
+            if watcher.pending.wait(WATCH_RESYNC_INTERVAL):
+                # Let a burst of writes settle, then sync them together
+                while watcher.pending.wait(WATCH_DEBOUNCE):
+                    watcher.pending.clear()
+            run_full_sync()
+    except KeyboardInterrupt:
+        print("\n⟡ Watch stopped.")
+    finally:
+        watcher.stop()
+
+
 # ═══════════════════════════════════════════════════════════════
 # CONTEXT GENERATION
 # ═══════════════════════════════════════════════════════════════
 
+def _fmt_age(seconds: int) -> str:
+    """Coarse human age: minutes under an hour, hours under a day, else days."""
+    if seconds < 3600:
+        return f"{seconds // 60} min ago"
+    if seconds < 86400:
+        return f"{seconds // 3600} hours ago"
+    return f"{seconds // 86400} days ago"
+
+
 def generate_cross_agent_context() -> str:
     """Generate context about what other agents have been doing."""
     memory = load_memory()
-    timeline = load_timeline()
+    now = datetime.now()
     
-    lines = ["## Cross-Agent Awareness\n"]
+    lines = ["## Cross-Agent Awareness\n", "### Agent Activity"]
     
     # Last active per agent
-    lines.append("### Agent Activity")
     for agent, data in memory["agents"].items():
         last = data.get("last_active")
         if last:
-            last_dt = datetime.fromisoformat(last)
-            age = datetime.now() - last_dt
-            if age.total_seconds() < 3600:
-                age_str = f"{int(age.total_seconds() / 60)} min ago"
-            elif age.total_seconds() < 86400:
-                age_str = f"{int(age.total_seconds() / 3600)} hours ago"
-            else:
-                age_str = f"{int(age.total_seconds() / 86400)} days ago"
-            
-            topics = data.get("recent_topics", [])[:3]
-            topics_str = ", ".join(topics) if topics else "—"
+            age_str = _fmt_age(int((now - datetime.fromisoformat(last)).total_seconds()))
+            topics_str = ", ".join(data.get("recent_topics", [])[:3]) or "—"
             lines.append(f"- **{agent}**: {age_str} | Topics: {topics_str}")
     
     # Recent handoff chain
     chain = memory.get("handoff_chain", [])[-5:]
     if chain:
         lines.append("\n### Recent Handoffs")
-        for h in reversed(chain):
-            status_icon = "✓" if h.get("status") == "completed" else "→"
-            lines.append(f"- {status_icon} {h['from']} → {h['to']}: {h.get('summary', '?')[:50]}")
+        lines.extend(
+            f"- {'✓' if h.get('status') == 'completed' else '→'} {h['from']} → {h['to']}: {h.get('summary', '?')[:50]}"
+            for h in reversed(chain)
+        )
     
     return "\n".join(lines)
 
@@ -366,14 +656,17 @@ def main():
         cmd = sys.argv[1]
         
         if cmd == "sync":
-            run_full_sync()
+            run_full_sync(force="--force" in sys.argv)
+        
+        elif cmd == "watch":
+            watch()
         
         elif cmd == "status":
             memory = load_memory()
             print(json.dumps(memory, indent=2))
         
         elif cmd == "timeline":
-            timeline = load_timeline()[-20:]
+            timeline = load_timeline(20)
             for entry in timeline:
                 ts = entry.get("timestamp", "")[:16]
                 agent = entry.get("agent", "?")
@@ -391,7 +684,8 @@ def main():
 ⟡ Cross-Agent Memory v1.0
 
 Commands:
-    sync      — Sync all agent activity
+    sync      — Sync all agent activity (--force rescans unchanged sources)
+    watch     — Keep syncing as agent activity lands
     status    — Show memory state
     timeline  — Show recent activity
     context   — Generate context for Claude
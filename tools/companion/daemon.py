@@ -23,16 +23,55 @@ import sys
 import json
 import time
 import fcntl
+import ctypes
+import asyncio
+import functools
 import signal
 import hashlib
+import threading
 import subprocess
+import urllib.error
+import urllib.request
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Deque, Dict, List, Optional, Any, Tuple
+from collections import deque
 from dataclasses import dataclass, asdict
 from enum import Enum
 import logging
 
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps_pretty(obj) -> bytes:
+        # Dataclasses serialize natively; datetimes and the like fall back to str
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2, default=str)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps_pretty(obj) -> bytes:
+        if hasattr(obj, "__dataclass_fields__"):
+            obj = asdict(obj)
+        return json.dumps(obj, indent=2, default=str).encode("utf-8")
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    from Quartz import CGSessionCopyCurrentDictionary
+except ImportError:
+    CGSessionCopyCurrentDictionary = None
+
+try:
+    from watchdog.observers import Observer  # FSEvents backend on macOS
+    from watchdog.events import FileSystemEventHandler
+except ImportError:
+    Observer = None
+    FileSystemEventHandler = object
+
 # ═══════════════════════════════════════════════════════════════
 # CONFIGURATION
 # ═══════════════════════════════════════════════════════════════
@@ -41,6 +80,7 @@ import logging
 PAUL_PULSE_INTERVAL = 300      # 5 minutes
 SYSTEM_OPS_INTERVAL = 900      # 15 minutes  
 API_PROBE_INTERVAL = 3600      # 60 minutes
+STATE_SAVE_INTERVAL = 60       # warm context refresh between steps
 
 # Paths
 HOME = Path.home()
@@ -65,9 +105,22 @@ GIT_REPOS = [
 # Files to NEVER commit
 FORBIDDEN_PATTERNS = [".env", "api_key", "secret", "password", "token"]
 
+# Subtrees never searched for iCloud placeholders (git object stores dominate file counts)
+ICLOUD_SKIP_DIRS = {".git", "node_modules", ".venv", "__pycache__"}
+# Full re-walk of the vault behind the event-maintained placeholder set (safety net)
+ICLOUD_RESEED_INTERVAL = 3600  # seconds
+
 # Idle threshold (seconds)
 IDLE_THRESHOLD = 300  # 5 minutes = considered idle
 
+# Local services probed for warm context health
+SERVICE_ENDPOINTS = {
+    "ollama": "http://localhost:11434/api/tags",
+    "mirrorbrain": "http://localhost:8081/health",
+    "superagent": "http://localhost:8765/status",
+}
+SERVICE_TIMEOUT = 2  # seconds
+
 # ═══════════════════════════════════════════════════════════════
 # LOGGING
 # ═══════════════════════════════════════════════════════════════
@@ -170,14 +223,14 @@ class WarmContext:
     system_health: Dict[str, Any]
     recent_pulse: List[str]
     
-    def to_json(self) -> str:
-        return json.dumps(asdict(self), indent=2, default=str)
+    def to_json(self) -> bytes:
+        return _dumps_pretty(self)
     
     @classmethod
     def load(cls, path: Path) -> Optional['WarmContext']:
         if path.exists():
             try:
-                data = json.loads(path.read_text())
+                data = _loads(path.read_bytes())
                 return cls(**data)
             except:
                 pass
@@ -187,13 +240,96 @@ class WarmContext:
 # SYSTEM DETECTION
 # ═══════════════════════════════════════════════════════════════
 
-def get_idle_time() -> int:
+async def _run(cmd: List[str], *, cwd: Optional[Path] = None, timeout: float = 5) -> subprocess.CompletedProcess:
+    """Run a command without blocking the event loop (subprocess.run semantics)."""
+    proc = await asyncio.create_subprocess_exec(
+        *cmd,
+        cwd=cwd,
+        stdout=asyncio.subprocess.PIPE,
+        stderr=asyncio.subprocess.PIPE,
+    )
+    try:
+        stdout, stderr = await asyncio.wait_for(proc.communicate(), timeout)
+    except asyncio.TimeoutError:
+        proc.kill()
+        await proc.wait()
+        raise subprocess.TimeoutExpired(cmd, timeout)
+    return subprocess.CompletedProcess(
+        cmd, proc.returncode,
+        stdout.decode(errors="replace"),
+        stderr.decode(errors="replace"),
+    )
+
+IOKIT_PATH = "/System/Library/Frameworks/IOKit.framework/IOKit"
+COREFOUNDATION_PATH = "/System/Library/Frameworks/CoreFoundation.framework/CoreFoundation"
+_kCFStringEncodingUTF8 = 0x08000100
+_kCFNumberSInt64Type = 4
+
+# (iokit, cf, IOHIDSystem service, "HIDIdleTime" key) once matched; False if unavailable
+_HID_SERVICE = None
+
+def _hid_service():
+    """Bind IOKit/CoreFoundation and match IOHIDSystem once per process."""
+    global _HID_SERVICE
+    if _HID_SERVICE is None:
+        _HID_SERVICE = False
+        try:
+            iokit = ctypes.CDLL(IOKIT_PATH)
+            cf = ctypes.CDLL(COREFOUNDATION_PATH)
+        except OSError:
+            return None
+        
+        iokit.IOServiceMatching.restype = ctypes.c_void_p
+        iokit.IOServiceMatching.argtypes = [ctypes.c_char_p]
+        iokit.IOServiceGetMatchingService.restype = ctypes.c_uint32
+        iokit.IOServiceGetMatchingService.argtypes = [ctypes.c_uint32, ctypes.c_void_p]
+        iokit.IORegistryEntryCreateCFProperty.restype = ctypes.c_void_p
+        iokit.IORegistryEntryCreateCFProperty.argtypes = [ctypes.c_uint32, ctypes.c_void_p, ctypes.c_void_p, ctypes.c_uint32]
+        cf.CFStringCreateWithCString.restype = ctypes.c_void_p
+        cf.CFStringCreateWithCString.argtypes = [ctypes.c_void_p, ctypes.c_char_p, ctypes.c_uint32]
+        cf.CFGetTypeID.restype = ctypes.c_ulong
+        cf.CFGetTypeID.argtypes = [ctypes.c_void_p]
+        cf.CFNumberGetTypeID.restype = ctypes.c_ulong
+        cf.CFNumberGetValue.restype = ctypes.c_bool
+        cf.CFNumberGetValue.argtypes = [ctypes.c_void_p, ctypes.c_int, ctypes.c_void_p]
+        cf.CFRelease.argtypes = [ctypes.c_void_p]
+        
+        # kIOMasterPortDefault is MACH_PORT_NULL; the matching dict is consumed
+        service = iokit.IOServiceGetMatchingService(0, iokit.IOServiceMatching(b"IOHIDSystem"))
+        if not service:
+            return None
+        key = cf.CFStringCreateWithCString(None, b"HIDIdleTime", _kCFStringEncodingUTF8)
+        _HID_SERVICE = (iokit, cf, service, key)
+    return _HID_SERVICE or None
+
+def _iokit_idle_ns() -> Optional[int]:
+    """HIDIdleTime straight from the IOHIDSystem registry entry, or None."""
+    hid = _hid_service()
+    if hid is None:
+        return None
+    iokit, cf, service, key = hid
+    prop = iokit.IORegistryEntryCreateCFProperty(service, key, None, 0)
+    if not prop:
+        return None
+    try:
+        if cf.CFGetTypeID(prop) != cf.CFNumberGetTypeID():
+            return None
+        value = ctypes.c_int64()
+        if not cf.CFNumberGetValue(prop, _kCFNumberSInt64Type, ctypes.byref(value)):
+            return None
+        return value.value
+    finally:
+        cf.CFRelease(prop)
+
+async def get_idle_time() -> int:
     """Get system idle time in seconds (macOS)."""
+    ns = _iokit_idle_ns()
+    if ns is not None:
+        return ns // 1_000_000_000
+    
+    # Fallback: scrape ioreg
     try:
-        result = subprocess.run(
-            ["ioreg", "-c", "IOHIDSystem"],
-            capture_output=True, text=True, timeout=5
-        )
+        result = await _run(["ioreg", "-c", "IOHIDSystem"])
         for line in result.stdout.split('\n'):
             if 'HIDIdleTime' in line:
                 # Value is in nanoseconds
@@ -205,31 +341,28 @@ def get_idle_time() -> int:
 
 def get_screen_locked() -> bool:
     """Check if screen is locked (macOS)."""
+    if CGSessionCopyCurrentDictionary is None:
+        return False
     try:
-        result = subprocess.run(
-            ["python3", "-c", 
-             "import Quartz; print(Quartz.CGSessionCopyCurrentDictionary().get('CGSSessionScreenIsLocked', False))"],
-            capture_output=True, text=True, timeout=5
-        )
-        return result.stdout.strip() == "True"
+        d = CGSessionCopyCurrentDictionary()
+        return bool(d and d.get('CGSSessionScreenIsLocked', False))
     except:
         return False
 
-def get_active_window() -> Optional[str]:
+async def get_active_window() -> Optional[str]:
     """Get currently active application."""
     try:
-        result = subprocess.run(
+        result = await _run(
             ["osascript", "-e", 
-             'tell application "System Events" to get name of first application process whose frontmost is true'],
-            capture_output=True, text=True, timeout=5
+             'tell application "System Events" to get name of first application process whose frontmost is true']
         )
         return result.stdout.strip() if result.returncode == 0 else None
     except:
         return None
 
-def get_user_state() -> UserState:
+async def get_user_state() -> UserState:
     """Determine current user state."""
-    idle_seconds = get_idle_time()
+    idle_seconds = await get_idle_time()
     screen_locked = get_screen_locked()
     
     if screen_locked or idle_seconds > 1800:  # 30 min
@@ -239,31 +372,41 @@ def get_user_state() -> UserState:
     else:
         return UserState.ACTIVE
 
+# (start hour, energy, mode); each band runs until the next one starts
+_TIME_BANDS = (
+    (0, "rest", "sleep"),
+    (5, "morning-rising", "planning"),
+    (9, "high", "execution"),
+    (12, "mid", "transition"),
+    (14, "sustained", "deep-work"),
+    (18, "winding", "reflection"),
+    (21, "low", "night-thoughts"),
+)
+
+# (energy, mode) for each hour 0-23
+HOUR_BUCKETS = tuple(
+    next((energy, mode) for start, energy, mode in reversed(_TIME_BANDS) if hour >= start)
+    for hour in range(24)
+)
+
+@functools.lru_cache(maxsize=1)
+def _minute_strings(minute: Tuple[int, int, int, int, int]) -> Tuple[str, str, str]:
+    """(time_readable, date, day) for a (y, m, d, H, M) minute; reused within that minute."""
+    dt = datetime(*minute)
+    return dt.strftime("%I:%M %p"), dt.strftime("%Y-%m-%d"), dt.strftime("%A")
+
 def get_time_context() -> Dict[str, Any]:
     """Get temporal context."""
     now = datetime.now()
     hour = now.hour
-    
-    if 5 <= hour < 9:
-        energy, mode = "morning-rising", "planning"
-    elif 9 <= hour < 12:
-        energy, mode = "high", "execution"
-    elif 12 <= hour < 14:
-        energy, mode = "mid", "transition"
-    elif 14 <= hour < 18:
-        energy, mode = "sustained", "deep-work"
-    elif 18 <= hour < 21:
-        energy, mode = "winding", "reflection"
-    elif 21 <= hour < 24:
-        energy, mode = "low", "night-thoughts"
-    else:
-        energy, mode = "rest", "sleep"
+    energy, mode = HOUR_BUCKETS[hour]
+    time_readable, date, day = _minute_strings((now.year, now.month, now.day, hour, now.minute))
     
     return {
         "timestamp": now.isoformat(),
-        "time_readable": now.strftime("%I:%M %p"),
-        "date": now.strftime("%Y-%m-%d"),
-        "day": now.strftime("%A"),
+        "time_readable": time_readable,
+        "date": date,
+        "day": day,
         "hour": hour,
         "energy_estimate": energy,
         "mode_estimate": mode,
@@ -273,99 +416,205 @@ def get_time_context() -> Dict[str, Any]:
 # GIT SENTINEL
 # ═══════════════════════════════════════════════════════════════
 
-def git_run(repo: Path, *args) -> subprocess.CompletedProcess:
+async def git_run(repo: Path, *args) -> subprocess.CompletedProcess:
     """Run git command in repo."""
-    return subprocess.run(
-        ["git"] + list(args),
-        cwd=repo,
-        capture_output=True,
-        text=True,
-        timeout=60
-    )
+    return await _run(["git"] + list(args), cwd=repo, timeout=60)
+
+def iter_icloud_placeholders(root: Path):
+    """Yields .icloud placeholder paths under root, pruning ICLOUD_SKIP_DIRS."""
+    for dirpath, dirs, files in os.walk(root):
+        dirs[:] = [d for d in dirs if d not in ICLOUD_SKIP_DIRS]
+        for name in files:
+            if name.endswith(".icloud"):
+                yield os.path.join(dirpath, name)
+
+def is_icloud_placeholder(path_str: str) -> bool:
+    """Event-path counterpart of iter_icloud_placeholders."""
+    return path_str.endswith(".icloud") and ICLOUD_SKIP_DIRS.isdisjoint(Path(path_str).parts)
 
 def check_icloud_sync_complete(path: Path) -> bool:
     """Check if iCloud sync is complete (no .icloud files)."""
     try:
-        for f in path.rglob("*.icloud"):
-            return False  # Still syncing
-        return True
+        return next(iter_icloud_placeholders(path), None) is None
     except:
         return True
 
-def has_forbidden_changes(repo: Path) -> bool:
-    """Check if staged changes include forbidden files."""
-    result = git_run(repo, "diff", "--cached", "--name-only")
-    if result.returncode != 0:
-        return True  # Assume forbidden on error
+class ICloudWatcher(FileSystemEventHandler):
+    """
+    Live set of .icloud placeholders under a tree, kept current from
+    filesystem events so the sentinel does not walk the vault each cycle.
+    """
+    
+    def __init__(self, root: Path):
+        super().__init__()
+        self.root = root
+        self.observer = None
+        self.seeded_at = 0.0
+        self._pending = set()
+        self._lock = threading.Lock()
+    
+    def start(self) -> bool:
+        """Starts watching and seeds the set with one walk; False if unavailable."""
+        if Observer is None or not self.root.is_dir():
+            return False
+        observer = Observer()
+        observer.schedule(self, str(self.root), recursive=True)
+        observer.daemon = True
+        observer.start()
+        self.observer = observer
+        # Seed after the observer is live so nothing created meanwhile is missed
+        seed = set(iter_icloud_placeholders(self.root))
+        with self._lock:
+            self._pending |= seed
+        self.seeded_at = time.monotonic()
+        return True
+    
+    def reseed(self):
+        """Replaces the set with a fresh walk, dropping anything events failed to clear."""
+        seed = set(iter_icloud_placeholders(self.root))
+        with self._lock:
+            self._pending = seed
+        self.seeded_at = time.monotonic()
     
-    for line in result.stdout.strip().split('\n'):
+    def stop(self):
+        if self.observer is not None:
+            self.observer.stop()
+            self.observer = None
+    
+    @property
+    def pending_count(self) -> int:
+        return len(self._pending)
+    
+    def _add_tree(self, dir_path: str):
+        """Adds the placeholders under a directory that appeared in the vault."""
+        if not dir_path.startswith(str(self.root) + os.sep):
+            return  # moved out of the vault
+        if not ICLOUD_SKIP_DIRS.isdisjoint(Path(dir_path).parts):
+            return
+        found = set(iter_icloud_placeholders(Path(dir_path)))
+        if found:
+            with self._lock:
+                self._pending |= found
+    
+    def on_created(self, event):
+        if event.is_directory:
+            self._add_tree(event.src_path)
+        elif is_icloud_placeholder(event.src_path):
+            with self._lock:
+                self._pending.add(event.src_path)
+    
+    def on_deleted(self, event):
+        with self._lock:
+            if event.is_directory:
+                # Everything under a removed (or moved-away) directory goes with it
+                prefix = event.src_path.rstrip(os.sep) + os.sep
+                self._pending = {p for p in self._pending if not p.startswith(prefix)}
+            else:
+                self._pending.discard(event.src_path)
+    
+    def on_moved(self, event):
+        self.on_deleted(event)
+        if event.is_directory:
+            self._add_tree(event.dest_path)
+        elif is_icloud_placeholder(event.dest_path) and event.dest_path.startswith(str(self.root) + os.sep):
+            with self._lock:
+                self._pending.add(event.dest_path)
+
+def has_forbidden_changes(paths: List[str]) -> bool:
+    """Check if changed paths (or git add -v lines) include forbidden files."""
+    for line in paths:
         for pattern in FORBIDDEN_PATTERNS:
             if pattern.lower() in line.lower():
                 log.warning(f"Forbidden file in changes: {line}")
                 return True
     return False
 
-def git_sentinel(repos: List[Path], night_shift: NightShift) -> List[str]:
+async def git_sentinel(repos: List[Path], night_shift: NightShift,
+                       icloud: Optional[ICloudWatcher] = None) -> List[str]:
     """Check and commit changes across repos."""
-    pulse_entries = []
     
-    for repo in repos:
+    async def icloud_synced(repo: Path) -> bool:
+        if icloud is not None and icloud.observer is not None and icloud.root == repo:
+            return icloud.pending_count == 0
+        return await asyncio.to_thread(check_icloud_sync_complete, repo)
+    
+    async def process_repo(repo: Path) -> List[str]:
+        pulse_entries = []
         if not (repo / ".git").exists():
-            continue
+            return pulse_entries
         
         repo_name = repo.name
         
-        # Check for uncommitted changes
-        status = git_run(repo, "status", "--porcelain")
+        # Check for uncommitted changes (every file, NUL-separated, rename sources included)
+        status = await git_run(repo, "status", "--porcelain", "-z", "--untracked-files=all")
         if status.returncode != 0:
             log.error(f"Git status failed for {repo_name}: {status.stderr}")
             night_shift.errors.append(f"git-status-{repo_name}")
-            continue
+            return pulse_entries
         
-        if not status.stdout.strip():
-            continue  # No changes
+        paths = []
+        change_count = 0
+        fields = iter(status.stdout.split('\0'))
+        for entry in fields:
+            if not entry:
+                continue
+            change_count += 1
+            paths.append(entry[3:])
+            if entry[0] in "RC":
+                paths.append(next(fields, ""))  # Rename/copy source is its own field
+        
+        if not change_count:
+            return pulse_entries  # No changes
         
-        change_count = len(status.stdout.strip().split('\n'))
         log.info(f"{repo_name}: {change_count} changes detected")
         
         # Wait for iCloud if it's the Vault
         if "obsidian" in str(repo).lower():
-            if not check_icloud_sync_complete(repo):
+            if not await icloud_synced(repo):
                 log.info(f"{repo_name}: Waiting for iCloud sync...")
                 pulse_entries.append(f"{datetime.now().strftime('%H:%M')} - {repo_name}: iCloud sync in progress")
-                continue
+                return pulse_entries
+        
+        # Check for forbidden files before anything is staged
+        if has_forbidden_changes(paths):
+            log.warning(f"{repo_name}: Aborted - forbidden files detected")
+            pulse_entries.append(f"{datetime.now().strftime('%H:%M')} - {repo_name}: Commit blocked (security)")
+            return pulse_entries
         
-        # Stage all changes
-        add_result = git_run(repo, "add", "-A")
+        # Stage all changes; -v lists what was staged, covering files that appeared since status
+        add_result = await git_run(repo, "add", "-A", "-v")
         if add_result.returncode != 0:
             log.error(f"Git add failed: {add_result.stderr}")
-            continue
+            return pulse_entries
         
-        # Check for forbidden files
-        if has_forbidden_changes(repo):
-            git_run(repo, "reset", "HEAD")  # Unstage
+        if has_forbidden_changes(add_result.stdout.splitlines()):
+            await git_run(repo, "reset", "HEAD")  # Unstage
             log.warning(f"{repo_name}: Aborted - forbidden files detected")
             pulse_entries.append(f"{datetime.now().strftime('%H:%M')} - {repo_name}: Commit blocked (security)")
-            continue
+            return pulse_entries
         
         # Commit
         timestamp = datetime.now().strftime("%Y-%m-%d %H:%M")
         commit_msg = f"[MirrorOS] Overnight sync: {timestamp}"
         
-        commit_result = git_run(repo, "commit", "-m", commit_msg)
+        commit_result = await git_run(repo, "commit", "-m", commit_msg)
         if commit_result.returncode == 0:
             night_shift.git_commits_made += 1
             log.info(f"{repo_name}: Committed successfully")
             pulse_entries.append(f"{datetime.now().strftime('%H:%M')} - {repo_name}: Git commit ({change_count} files)")
             
             # Push (non-blocking, don't fail if offline)
-            push_result = git_run(repo, "push")
+            push_result = await git_run(repo, "push")
             if push_result.returncode != 0:
                 log.warning(f"{repo_name}: Push failed (offline?)")
         else:
             log.warning(f"{repo_name}: Commit failed: {commit_result.stderr}")
+        
+        return pulse_entries
     
-    return pulse_entries
+    # Repos are independent: the slowest one bounds the sweep, not the sum
+    results = await asyncio.gather(*[process_repo(repo) for repo in repos])
+    return [entry for entries in results for entry in entries]
 
 # ═══════════════════════════════════════════════════════════════
 # API BRIDGE PROBE
@@ -380,27 +629,11 @@ def probe_api_bridge() -> Dict[str, Any]:
         "openai": False,
     }
     
-    # Check Anthropic
+    # Check Anthropic (key format only; nothing is sent)
     anthropic_key = os.getenv("ANTHROPIC_API_KEY")
-    if anthropic_key:
-        try:
-            import urllib.request
-            req = urllib.request.Request(
-                "https://api.anthropic.com/v1/messages",
-                headers={
-                    "x-api-key": anthropic_key,
-                    "anthropic-version": "2023-06-01",
-                    "content-type": "application/json"
-                },
-                data=b'{"model":"claude-3-haiku-20240307","max_tokens":1,"messages":[{"role":"user","content":"ping"}]}'
-            )
-            # Just check if we get a response, don't actually send
-            # Actually, let's just verify the key format
-            if anthropic_key.startswith("sk-ant-"):
-                result["anthropic"] = True
-                result["status"] = "active"
-        except:
-            pass
+    if anthropic_key and anthropic_key.startswith("sk-ant-"):
+        result["anthropic"] = True
+        result["status"] = "active"
     
     # Check OpenAI
     openai_key = os.getenv("OPENAI_API_KEY")
@@ -415,19 +648,21 @@ def probe_api_bridge() -> Dict[str, Any]:
 # WARM CONTEXT GENERATION
 # ═══════════════════════════════════════════════════════════════
 
-def generate_warm_context(
+async def generate_warm_context(
     paul_state: Dict,
     night_shift: NightShift,
-    pulse_log: List[str],
-    boot_time: datetime
+    pulse_log: Deque[str],
+    boot_time: datetime,
+    http: Optional["httpx.AsyncClient"] = None
 ) -> WarmContext:
     """Generate the morning handshake artifact."""
     
     # System health
+    repos_clean, services = await asyncio.gather(all_repos_clean(), check_services(http))
     system_health = {
         "disk_free_gb": get_disk_free(),
-        "repos_clean": all_repos_clean(),
-        "services": check_services(),
+        "repos_clean": repos_clean,
+        "services": services,
     }
     
     # API bridge status
@@ -450,69 +685,52 @@ def generate_warm_context(
             "errors": night_shift.errors[-5:] if night_shift.errors else []
         },
         system_health=system_health,
-        recent_pulse=pulse_log[-20:]  # Last 20 entries
+        recent_pulse=list(pulse_log)[-20:]  # Last 20 entries
     )
 
 def get_disk_free() -> float:
     """Get free disk space in GB."""
     try:
-        result = subprocess.run(
-            ["df", "-g", "/"],
-            capture_output=True, text=True, timeout=5
-        )
-        lines = result.stdout.strip().split('\n')
-        if len(lines) > 1:
-            parts = lines[1].split()
-            return float(parts[3])  # Available
-    except:
-        pass
-    return -1
+        st = os.statvfs("/")
+        return round(st.f_bavail * st.f_frsize / (1024 ** 3), 1)
+    except OSError:
+        return -1
 
-def all_repos_clean() -> bool:
+async def all_repos_clean() -> bool:
     """Check if all repos are clean."""
-    for repo in GIT_REPOS:
-        if not (repo / ".git").exists():
-            continue
-        result = git_run(repo, "status", "--porcelain")
-        if result.stdout.strip():
-            return False
-    return True
+    repos = [repo for repo in GIT_REPOS if (repo / ".git").exists()]
+    results = await asyncio.gather(*[git_run(repo, "status", "--porcelain") for repo in repos])
+    return not any(result.stdout.strip() for result in results)
 
-def check_services() -> Dict[str, str]:
-    """Check critical services."""
-    services = {}
-    
-    # Ollama
-    try:
-        result = subprocess.run(
-            ["curl", "-s", "-o", "/dev/null", "-w", "%{http_code}", "http://localhost:11434/api/tags"],
-            capture_output=True, text=True, timeout=5
-        )
-        services["ollama"] = "up" if result.stdout.strip() == "200" else "down"
-    except:
-        services["ollama"] = "unknown"
-    
-    # MirrorBrain
+def _http_status(url: str) -> int:
+    """Blocking status fetch, used when httpx is not installed."""
     try:
-        result = subprocess.run(
-            ["curl", "-s", "-o", "/dev/null", "-w", "%{http_code}", "http://localhost:8081/health"],
-            capture_output=True, text=True, timeout=5
-        )
-        services["mirrorbrain"] = "up" if result.stdout.strip() == "200" else "down"
-    except:
-        services["mirrorbrain"] = "unknown"
-    
-    # Superagent
+        with urllib.request.urlopen(url, timeout=SERVICE_TIMEOUT) as resp:
+            return resp.status
+    except urllib.error.HTTPError as e:
+        return e.code
+    except urllib.error.URLError as e:
+        if isinstance(e.reason, TimeoutError):
+            raise
+        return 0  # Nothing listening
+
+async def _probe_service(url: str, http: Optional["httpx.AsyncClient"] = None) -> str:
     try:
-        result = subprocess.run(
-            ["curl", "-s", "-o", "/dev/null", "-w", "%{http_code}", "http://localhost:8765/status"],
-            capture_output=True, text=True, timeout=5
-        )
-        services["superagent"] = "up" if result.stdout.strip() == "200" else "down"
+        if http is not None:
+            try:
+                status = (await http.get(url)).status_code
+            except httpx.ConnectError:
+                status = 0  # Nothing listening
+        else:
+            status = await asyncio.to_thread(_http_status, url)
+        return "up" if status == 200 else "down"
     except:
-        services["superagent"] = "unknown"
-    
-    return services
+        return "unknown"
+
+async def check_services(http: Optional["httpx.AsyncClient"] = None) -> Dict[str, str]:
+    """Check critical services."""
+    states = await asyncio.gather(*[_probe_service(url, http) for url in SERVICE_ENDPOINTS.values()])
+    return dict(zip(SERVICE_ENDPOINTS, states))
 
 # ═══════════════════════════════════════════════════════════════
 # MAIN DAEMON
@@ -524,23 +742,23 @@ class MirrorOSDaemon:
     def __init__(self):
         self.boot_time = datetime.now()
         self.night_shift = NightShift()
-        self.pulse_log: List[str] = []
-        self.last_paul_pulse = datetime.min
-        self.last_system_ops = datetime.min
-        self.last_api_probe = datetime.min
+        self.pulse_log: Deque[str] = deque(maxlen=100)  # Keep last 100 entries
         self.last_user_state = UserState.ACTIVE
         self.sleep_start: Optional[datetime] = None
         self.running = False
         self.lock = DaemonLock(LOCK_FILE)
+        # Created inside the event loop by _main()
+        self._stop: Optional[asyncio.Event] = None
+        self._state_lock: Optional[asyncio.Lock] = None
+        self._http: Optional["httpx.AsyncClient"] = None
+        self._icloud = ICloudWatcher(VAULT)
+        self._last_state_hash: Optional[bytes] = None
     
     def log_pulse(self, message: str):
         """Add entry to pulse log."""
         entry = f"{datetime.now().strftime('%H:%M')} - {message}"
         self.pulse_log.append(entry)
         log.info(message)
-        
-        # Keep last 100 entries
-        self.pulse_log = self.pulse_log[-100:]
     
     def handle_user_state_change(self, new_state: UserState):
         """Handle transitions between user states."""
@@ -572,11 +790,10 @@ class MirrorOSDaemon:
                 minutes = (duration % 3600) // 60
                 self.log_pulse(f"Wake Detected (was {new_state.value} for {hours}h {minutes}m)")
     
-    def paul_pulse(self):
+    async def paul_pulse(self):
         """5-minute Paul awareness pulse."""
         time_ctx = get_time_context()
-        user_state = get_user_state()
-        active_window = get_active_window()
+        user_state, active_window = await asyncio.gather(get_user_state(), get_active_window())
         
         self.handle_user_state_change(user_state)
         
@@ -584,45 +801,142 @@ class MirrorOSDaemon:
         if user_state == UserState.ACTIVE:
             self.log_pulse(f"Paul Active: {active_window or 'unknown'} | Energy: {time_ctx['energy_estimate']}")
     
-    def system_ops(self):
+    async def system_ops(self):
         """15-minute system operations."""
         self.log_pulse("System Ops: Starting git sentinel")
         
-        new_entries = git_sentinel(GIT_REPOS, self.night_shift)
+        icloud = self._icloud
+        if icloud.observer is not None and time.monotonic() - icloud.seeded_at >= ICLOUD_RESEED_INTERVAL:
+            await asyncio.to_thread(icloud.reseed)
+        
+        new_entries = await git_sentinel(GIT_REPOS, self.night_shift, self._icloud)
         self.pulse_log.extend(new_entries)
     
-    def api_probe(self):
+    async def api_probe(self):
         """Hourly API bridge check."""
         bridge = probe_api_bridge()
         self.night_shift.bridge_connectivity = bridge["status"] == "active"
         self.log_pulse(f"API Bridge: {bridge['status']}")
     
-    def save_state(self):
+    async def save_state(self):
         """Save warm context to disk."""
+        if self._state_lock is None:
+            await self._save_state()
+            return
+        # Steps finish independently; one writer at a time
+        async with self._state_lock:
+            await self._save_state()
+    
+    async def _save_state(self):
         DAEMON_DIR.mkdir(parents=True, exist_ok=True)
         
         paul_state = {
             "user_state": self.last_user_state.value,
             "time": get_time_context(),
-            "active_window": get_active_window(),
+            "active_window": await get_active_window(),
         }
         
-        context = generate_warm_context(
+        context = await generate_warm_context(
             paul_state,
             self.night_shift,
             self.pulse_log,
-            self.boot_time
+            self.boot_time,
+            self._http
         )
         
-        WARM_CONTEXT.write_text(context.to_json())
+        # Byte-identical context: bump the mtime instead of rewriting
+        payload = context.to_json()
+        state_hash = hashlib.blake2b(payload, digest_size=16).digest()
+        written = False
+        if state_hash == self._last_state_hash:
+            try:
+                os.utime(WARM_CONTEXT)
+                written = True
+            except FileNotFoundError:
+                pass
+        if not written:
+            tmp = WARM_CONTEXT.with_suffix(".tmp")
+            tmp.write_bytes(payload)
+            os.replace(tmp, WARM_CONTEXT)
+            self._last_state_hash = state_hash
         
         # Also write daemon state
-        DAEMON_STATE.write_text(json.dumps({
+        DAEMON_STATE.write_bytes(_dumps_pretty({
             "pid": os.getpid(),
             "boot_time": self.boot_time.isoformat(),
             "last_pulse": datetime.now().isoformat(),
             "status": "running"
-        }, indent=2))
+        }))
+    
+    def _open_http(self):
+        """Pooled client for the local service probes (None without httpx)."""
+        if httpx is not None and self._http is None:
+            self._http = httpx.AsyncClient(timeout=SERVICE_TIMEOUT)
+    
+    async def _close_http(self):
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+    
+    async def pulse_once(self):
+        """Every step once, in order (CLI --pulse)."""
+        self._open_http()
+        try:
+            await self.paul_pulse()
+            await self.system_ops()
+            await self.api_probe()
+            await self.save_state()
+        finally:
+            await self._close_http()
+    
+    def _request_stop(self):
+        log.info("Shutdown signal received")
+        self.running = False
+        self._stop.set()
+    
+    async def _sleep(self, seconds: float):
+        """Sleep that returns early once shutdown is requested."""
+        try:
+            await asyncio.wait_for(self._stop.wait(), timeout=seconds)
+        except asyncio.TimeoutError:
+            pass
+    
+    async def _every(self, interval: float, step, save: bool = True):
+        """Run step on its own schedule until shutdown, saving state after each run."""
+        while self.running:
+            await step()
+            if save:
+                await self.save_state()
+            await self._sleep(interval)
+    
+    async def _main(self):
+        self._stop = asyncio.Event()
+        self._state_lock = asyncio.Lock()
+        self._open_http()
+        if await asyncio.to_thread(self._icloud.start):
+            log.info(f"Watching {VAULT.name} for iCloud placeholders ({self._icloud.pending_count} pending)")
+        
+        loop = asyncio.get_running_loop()
+        for sig in (signal.SIGTERM, signal.SIGINT):
+            loop.add_signal_handler(sig, self._request_stop)
+        
+        try:
+            # Independent timers: a slow git sync no longer delays the pulse
+            await asyncio.gather(
+                self._every(PAUL_PULSE_INTERVAL, self.paul_pulse),
+                self._every(SYSTEM_OPS_INTERVAL, self.system_ops),
+                self._every(API_PROBE_INTERVAL, self.api_probe),
+                self._every(STATE_SAVE_INTERVAL, self.save_state, save=False),
+            )
+        except Exception as e:
+            log.error(f"Daemon error: {e}")
+            self.night_shift.errors.append(str(e))
+            raise
+        finally:
+            self.night_shift.status = "complete"
+            await self.save_state()
+            await self._close_http()
+            self._icloud.stop()
     
     def run(self):
         """Main daemon loop."""
@@ -635,47 +949,9 @@ class MirrorOSDaemon:
         log.info(f"⟡ MirrorOS Daemon v2.0 started (PID: {os.getpid()})")
         self.log_pulse("Daemon Boot")
         
-        # Signal handlers
-        def shutdown(signum, frame):
-            log.info("Shutdown signal received")
-            self.running = False
-        
-        signal.signal(signal.SIGTERM, shutdown)
-        signal.signal(signal.SIGINT, shutdown)
-        
         try:
-            while self.running:
-                now = datetime.now()
-                
-                # Paul pulse (every 5 min)
-                if (now - self.last_paul_pulse).seconds >= PAUL_PULSE_INTERVAL:
-                    self.paul_pulse()
-                    self.last_paul_pulse = now
-                
-                # System ops (every 15 min)
-                if (now - self.last_system_ops).seconds >= SYSTEM_OPS_INTERVAL:
-                    self.system_ops()
-                    self.last_system_ops = now
-                
-                # API probe (every 60 min)
-                if (now - self.last_api_probe).seconds >= API_PROBE_INTERVAL:
-                    self.api_probe()
-                    self.last_api_probe = now
-                
-                # Save state after each cycle
-                self.save_state()
-                
-                # Sleep until next check (1 minute resolution)
-                time.sleep(60)
-        
-        except Exception as e:
-            log.error(f"Daemon error: {e}")
-            self.night_shift.errors.append(str(e))
-            raise
-        
+            asyncio.run(self._main())
         finally:
-            self.night_shift.status = "complete"
-            self.save_state()
             self.lock.release()
             log.info("⟡ Daemon shutdown complete")
 
@@ -702,15 +978,12 @@ def main():
         elif cmd == "--pulse":
             # Single pulse for testing
             daemon = MirrorOSDaemon()
-            daemon.paul_pulse()
-            daemon.system_ops()
-            daemon.api_probe()
-            daemon.save_state()
+            asyncio.run(daemon.pulse_once())
             print(WARM_CONTEXT.read_text())
         
         elif cmd == "--stop":
             if DAEMON_STATE.exists():
-                state = json.loads(DAEMON_STATE.read_text())
+                state = _loads(DAEMON_STATE.read_bytes())
                 pid = state.get("pid")
                 if pid:
                     os.kill(pid, signal.SIGTERM)
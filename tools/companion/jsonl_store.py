@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+⟡ CLAUDE COMPANION — JSONL Store
+
+Append-only JSONL logs and atomic file writes shared by the companion
+tools (companion_daemon, api_bridge, cross_agent_memory).
+
+Author: Claude (Reflective Twin)
+For: Paul
+"""
+
+import os
+import json
+import logging
+import mmap
+from itertools import islice
+from pathlib import Path
+from typing import Dict, List
+
+try:
+    import orjson
+    _loads = orjson.loads
+
+    def _dumps(obj) -> bytes:
+        return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS)
+except ImportError:
+    _loads = json.loads
+
+    def _dumps(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+logger = logging.getLogger("mirrordna.companion")
+
+
+def atomic_write_bytes(path: Path, data: bytes):
+    """Write-then-rename so concurrent readers never see a truncated file."""
+    tmp = path.with_suffix(path.suffix + ".tmp")
+    tmp.write_bytes(data)
+    os.replace(tmp, path)
+
+
+def migrate_legacy_log(legacy: Path, path: Path):
+    """Rewrites a legacy JSON-array log as JSONL (once)."""
+    if path.exists() or not legacy.exists():
+        return
+    try:
+        records = _loads(legacy.read_bytes())
+    except (OSError, ValueError):
+        return
+    atomic_write_bytes(path, b"".join(_dumps(r) + b"\n" for r in records))
+    legacy.unlink()
+
+
+def append_jsonl(path: Path, *records: Dict):
+    """Appends records in one write; earlier lines are never rewritten."""
+    with open(path, "ab") as f:
+        f.write(b"".join(_dumps(r) + b"\n" for r in records))
+
+
+def iter_jsonl_reversed(path: Path):
+    """Yields records newest first, walking back from the end of an mmap."""
+    try:
+        f = open(path, "rb")
+    except FileNotFoundError:
+        return
+    except OSError as e:
+        logger.warning("%s unreadable: %s", path.name, e)
+        return
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size == 0:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            pos = size - 1 if mm[size - 1:size] == b"\n" else size
+            while pos > 0:
+                start = mm.rfind(b"\n", 0, pos) + 1
+                if start < pos:
+                    try:
+                        yield _loads(mm[start:pos])
+                    except ValueError:
+                        pass  # torn trailing write
+                pos = start - 1
+
+
+def tail_jsonl(path: Path, n: int) -> List[Dict]:
+    """Parses only the last n records, returned oldest first."""
+    records = list(islice(iter_jsonl_reversed(path), n))
+    records.reverse()
+    return records
+
+
+def compact_jsonl(path: Path, keep: int, max_bytes: int):
+    """
+    Once the log outgrows max_bytes and holds over 2 * keep records, rewrites it
+    with the raw bytes of the last `keep` lines (no re-parse). Trimming only when
+    `keep` records have accumulated since the last trim keeps appends amortized O(1).
+    """
+    try:
+        f = open(path, "rb")
+    except OSError:
+        return
+    with f:
+        size = os.fstat(f.fileno()).st_size
+        if size <= max_bytes:
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            # Walk back at most 2 * keep lines; the keep-th boundary is where the tail starts
+            pos = size - 1 if mm[size - 1:size] == b"\n" else size
+            cut = None
+            for n in range(1, 2 * keep + 1):
+                pos = mm.rfind(b"\n", 0, pos)
+                if pos < 0:
+                    return
+                if n == keep:
+                    cut = pos
+            tail = mm[cut + 1:]
+    atomic_write_bytes(path, tail)
@@ -307,7 +307,10 @@ def query_claude(text: str) -> Optional[str]:
     
     queries.append(payload)
     COMPANION_DIR.mkdir(parents=True, exist_ok=True)
-    queries_file.write_text(json.dumps(queries, indent=2))
+    # Write-then-rename: api_bridge may be reading the queue concurrently
+    tmp = queries_file.with_suffix(".json.tmp")
+    tmp.write_text(json.dumps(queries, separators=(",", ":")))
+    os.replace(tmp, queries_file)
     
     # For now, acknowledge receipt
     return f"I heard: {text}. Query logged for processing."